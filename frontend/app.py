@@ -7,9 +7,6 @@ import sys
 # Add src to path
 sys.path.append(str(Path(__file__).parent.parent))
 
-from pages.extraction import extraction_page
-from pages.history import history_page
-from pages.settings import settings_page
 from components.sidebar import render_sidebar
 
 # Page configuration
@@ -21,7 +18,7 @@ st.set_page_config(
 )
 
 # Custom CSS
-st.markdown("""
+CSS = """
 <style>
     .main {
         padding: 2rem;
@@ -41,11 +38,20 @@ st.markdown("""
         font-family: 'Computer Modern', serif;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+@st.cache_resource
+def inject_css():
+    """Inject the app CSS once instead of on every rerun"""
+    st.markdown(CSS, unsafe_allow_html=True)
+    return True
 
 def main():
     """Main application"""
-    
+
+    # Inject CSS (no-op on reruns thanks to the cache)
+    inject_css()
+
     # Render sidebar
     page = render_sidebar()
     
@@ -54,12 +60,16 @@ def main():
     st.markdown("**Extract and convert mathematical questions to LaTeX format**")
     st.divider()
     
-    # Route to selected page
+    # Route to selected page (lazy imports keep cold-start light:
+    # only the active page's dependencies are loaded)
     if page == "Extract Questions":
+        from pages.extraction import extraction_page
         extraction_page()
     elif page == "History":
+        from pages.history import history_page
         history_page()
     elif page == "Settings":
+        from pages.settings import settings_page
         settings_page()
 
 if __name__ == "__main__":
@@ -2,6 +2,23 @@
 
 import streamlit as st
 import base64
+import functools
+import hashlib
+
+@functools.lru_cache(maxsize=4096)
+def _widget_key(latex_code: str) -> str:
+    """Stable short digest for widget keys
+
+    Unlike built-in hash(), this is process-stable and computed once
+    per unique string thanks to the lru_cache.
+
+    Args:
+        latex_code: LaTeX code to key on
+
+    Returns:
+        Hex digest suitable for a widget key
+    """
+    return hashlib.blake2b(latex_code.encode(), digest_size=6).hexdigest()
 
 def render_latex_preview(latex_code: str):
     """Render LaTeX preview
@@ -17,7 +34,7 @@ def render_latex_preview(latex_code: str):
         st.code(latex_code, language='latex')
         
         # Option to render using online service
-        if st.button("Render LaTeX", key=f"render_{hash(latex_code)}"):
+        if st.button("Render LaTeX", key=f"render_{_widget_key(latex_code)}"):
             # This would call an online LaTeX rendering service
             # For now, just show the code
             st.info("LaTeX rendering requires external service setup")
\ No newline at end of file
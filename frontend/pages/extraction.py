@@ -2,14 +2,222 @@
 
 import streamlit as st
 from pathlib import Path
+import atexit
+import functools
+import hashlib
+import json
 import tempfile
 from typing import Optional
 
-from src.rag.rag_pipeline import RAGPipeline
-from src.core.constants import CHAPTER_TOPICS
+from src.core.constants import (
+    CHAPTERS,
+    CHAPTER_TOPIC_KEYS,
+    CHAPTER_LABELS,
+    TOPIC_LABELS,
+)
 from src.output.exporter import Exporter
 from frontend.components.upload import render_upload
-from frontend.components.preview import render_latex_preview
+
+# Tempfiles spilled for uploads this process; unlinked at exit so
+# repeated sessions don't leak disk
+_spilled_tempfiles = []
+
+def _cleanup_spilled_tempfiles():
+    """Unlink PDF tempfiles created for uploads"""
+    for path in _spilled_tempfiles:
+        Path(path).unlink(missing_ok=True)
+
+atexit.register(_cleanup_spilled_tempfiles)
+
+@st.cache_resource(show_spinner=False)
+def get_pipeline():
+    """Build the RAG pipeline once per server process and reuse it
+
+    Returns:
+        Shared RAGPipeline instance
+    """
+    # Imported lazily so the page renders before the heavy pipeline
+    # dependencies are loaded
+    from src.rag.rag_pipeline import RAGPipeline
+    return RAGPipeline()
+
+@st.cache_data(show_spinner=False, ttl=24 * 60 * 60, max_entries=32)
+def run_extraction(pdf_hash: str, _pdf_path: Path, chapter: int, topic: str) -> dict:
+    """Run the extraction pipeline, memoized on PDF content hash + selection
+
+    Args:
+        pdf_hash: Content digest of the uploaded PDF (the cache key, so
+            Streamlit hashes a short string instead of the full bytes)
+        _pdf_path: Path to the spilled PDF (excluded from hashing)
+        chapter: Chapter number
+        topic: Topic identifier
+
+    Returns:
+        Extraction results dictionary
+    """
+    return get_pipeline().process_pdf(
+        pdf_path=_pdf_path,
+        chapter=chapter,
+        topic=topic
+    )
+
+@st.cache_resource
+def get_exporter() -> Exporter:
+    """Share one Exporter instance across reruns
+
+    Returns:
+        Shared Exporter instance
+    """
+    return Exporter()
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def export_questions(questions_json: str, format: str) -> str:
+    """Render questions in the given format, cached on content
+
+    Args:
+        questions_json: JSON-encoded list of questions (cache key)
+        format: One of "latex", "markdown", "json"
+
+    Returns:
+        Serialized export content
+    """
+    questions = json.loads(questions_json)
+    exporter = get_exporter()
+
+    if format == "latex":
+        return exporter.export_latex(questions)
+    elif format == "markdown":
+        return exporter.export_markdown(questions)
+    else:
+        return exporter.export_json(questions)
+
+@st.cache_data(show_spinner=False)
+def bucket_questions(questions_json: str) -> dict:
+    """Group questions by type once per results set
+
+    Args:
+        questions_json: JSON-encoded list of questions (cache key)
+
+    Returns:
+        Mapping of question type (plus "All") to question lists
+    """
+    questions = json.loads(questions_json)
+    buckets = {"All": questions}
+
+    for question in questions:
+        buckets.setdefault(question['question_type'], []).append(question)
+
+    return buckets
+
+@functools.lru_cache(maxsize=2048)
+def render_question_body(original_text: str, latex: str, page_number, number, confidence: float) -> str:
+    """Build the markdown blob for one question expander
+
+    One st.markdown per expander is a single element round-trip to the
+    browser instead of half a dozen widgets, and the lru_cache skips the
+    string formatting on reruns.
+
+    Args:
+        original_text: Raw extracted question text
+        latex: LaTeX formatted question
+        page_number: Source page number
+        number: Question number
+        confidence: Extraction confidence
+
+    Returns:
+        Markdown body for the question
+    """
+    return (
+        f"**Original Text:**\n\n{original_text}\n\n"
+        f"**LaTeX Format:**\n\n```latex\n{latex}\n```\n\n"
+        f"<sub>Page: {page_number} · Number: {number} · "
+        f"Confidence: {confidence:.2f}</sub>"
+    )
+
+@st.fragment
+def results_fragment(results: dict):
+    """Render extraction results, filters, and export buttons
+
+    Runs as a fragment so filter/export interactions rerun only this
+    block, not the upload/selection code above it.
+
+    Args:
+        results: Extraction results dictionary
+    """
+    # Stable cache key shared by the bucket map and the exporters
+    questions_json = json.dumps(results['questions'], sort_keys=True)
+
+    st.subheader("Extraction Results")
+
+    # Summary
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Total Questions", results['total_questions'])
+    with col2:
+        st.metric("Chapter", results['chapter'])
+    with col3:
+        st.metric("Topic", results['topic'])
+
+    # Questions display
+    st.subheader("Extracted Questions")
+
+    # Filter options: the bucket map is computed once per results
+    # set, so a filter change is a dict lookup on rerun
+    buckets = bucket_questions(questions_json)
+
+    filter_type = st.selectbox(
+        "Filter by Type",
+        list(buckets.keys())
+    )
+
+    filtered_questions = buckets[filter_type]
+
+    for i, question in enumerate(filtered_questions, 1):
+        with st.expander(f"Question {i} - {question.get('question_type', 'Unknown')}"):
+            st.markdown(
+                render_question_body(
+                    question['original_text'],
+                    question['latex'],
+                    question.get('page_number', 'N/A'),
+                    question.get('number', 'N/A'),
+                    question.get('confidence', 0)
+                ),
+                unsafe_allow_html=True
+            )
+
+    # Export options
+    st.subheader("Export Results")
+
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.download_button(
+            label="📄 Download LaTeX",
+            data=export_questions(questions_json, "latex"),
+            file_name=f"questions_{results['chapter']}_{results['topic']}.tex",
+            mime="text/plain"
+        )
+
+    with col2:
+        st.download_button(
+            label="📝 Download Markdown",
+            data=export_questions(questions_json, "markdown"),
+            file_name=f"questions_{results['chapter']}_{results['topic']}.md",
+            mime="text/markdown"
+        )
+
+    with col3:
+        st.download_button(
+            label="📊 Download JSON",
+            data=export_questions(questions_json, "json"),
+            file_name=f"questions_{results['chapter']}_{results['topic']}.json",
+            mime="application/json"
+        )
+
+    with col4:
+        if st.button("📑 Export as PDF"):
+            # This would require LaTeX compilation
+            st.info("PDF export requires LaTeX installation")
 
 def extraction_page():
     """Render extraction page"""
@@ -20,29 +228,43 @@ def extraction_page():
     uploaded_file = render_upload()
     
     if uploaded_file:
-        # Save uploaded file temporarily
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp:
-            tmp.write(uploaded_file.read())
-            pdf_path = Path(tmp.name)
-        
+        # Save uploaded file temporarily. getbuffer() is a zero-copy view
+        # over the upload, and the per-upload session-state map means the
+        # write happens once per file, not once per widget rerun
+        upload_key = (uploaded_file.name, uploaded_file.size)
+        pdf_paths = st.session_state.setdefault('_pdf_paths', {})
+        pdf_hashes = st.session_state.setdefault('_pdf_hashes', {})
+
+        if upload_key not in pdf_paths:
+            # Hash the upload once; everything downstream keys on the digest
+            pdf_buffer = uploaded_file.getbuffer()
+            with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp:
+                tmp.write(pdf_buffer)
+            pdf_paths[upload_key] = Path(tmp.name)
+            pdf_hashes[upload_key] = hashlib.blake2b(
+                pdf_buffer, digest_size=16
+            ).hexdigest()
+            _spilled_tempfiles.append(tmp.name)
+
+        pdf_path = pdf_paths[upload_key]
+        pdf_hash = pdf_hashes[upload_key]
+
         # Chapter and topic selection
         col1, col2 = st.columns(2)
         
         with col1:
-            chapters = list(CHAPTER_TOPICS.keys())
             chapter = st.selectbox(
                 "Select Chapter",
-                chapters,
-                format_func=lambda x: f"Chapter {x}: {CHAPTER_TOPICS[x]['name']}"
+                CHAPTERS,
+                format_func=CHAPTER_LABELS.get
             )
-        
+
         with col2:
             if chapter:
-                topics = list(CHAPTER_TOPICS[chapter]['topics'].items())
                 topic = st.selectbox(
                     "Select Topic",
-                    [t[0] for t in topics],
-                    format_func=lambda x: f"{x}: {CHAPTER_TOPICS[chapter]['topics'][x]}"
+                    CHAPTER_TOPIC_KEYS[chapter],
+                    format_func=TOPIC_LABELS.get
                 )
         
         # Extraction options
@@ -51,21 +273,24 @@ def extraction_page():
             include_examples = st.checkbox("Include Examples", value=True)
             include_exercises = st.checkbox("Include Exercises", value=True)
             use_ocr = st.checkbox("Use OCR for scanned pages", value=True)
-        
+
+            if st.button("🔄 Reload pipeline", help="Rebuild the pipeline (e.g. after changing the API key)"):
+                get_pipeline.clear()
+                st.success("Pipeline will be rebuilt on next extraction")
+
         # Extract button
         if st.button("🚀 Extract Questions", type="primary"):
             with st.spinner("Extracting questions... This may take a few minutes."):
                 try:
-                    # Initialize pipeline
-                    pipeline = RAGPipeline()
-                    
-                    # Process PDF
-                    results = pipeline.process_pdf(
-                        pdf_path=pdf_path,
-                        chapter=chapter,
-                        topic=topic
+                    # Memoized on PDF digest + chapter/topic, so repeat
+                    # extractions of the same combo are cache hits
+                    results = run_extraction(
+                        pdf_hash,
+                        pdf_path,
+                        chapter,
+                        topic
                     )
-                    
+
                     # Store in session state
                     st.session_state['extraction_results'] = results
                     
@@ -76,93 +301,4 @@ def extraction_page():
         
         # Display results
         if 'extraction_results' in st.session_state:
-            results = st.session_state['extraction_results']
-            
-            st.subheader("Extraction Results")
-            
-            # Summary
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.metric("Total Questions", results['total_questions'])
-            with col2:
-                st.metric("Chapter", results['chapter'])
-            with col3:
-                st.metric("Topic", results['topic'])
-            
-            # Questions display
-            st.subheader("Extracted Questions")
-            
-            # Filter options
-            filter_type = st.selectbox(
-                "Filter by Type",
-                ["All"] + list(set(q['question_type'] for q in results['questions']))
-            )
-            
-            # Display questions
-            filtered_questions = results['questions']
-            if filter_type != "All":
-                filtered_questions = [
-                    q for q in results['questions'] 
-                    if q['question_type'] == filter_type
-                ]
-            
-            for i, question in enumerate(filtered_questions, 1):
-                with st.expander(f"Question {i} - {question.get('question_type', 'Unknown')}"):
-                    # Original text
-                    st.markdown("**Original Text:**")
-                    st.text(question['original_text'])
-                    
-                    # LaTeX preview
-                    st.markdown("**LaTeX Format:**")
-                    render_latex_preview(question['latex'])
-                    
-                    # Metadata
-                    col1, col2, col3 = st.columns(3)
-                    with col1:
-                        st.caption(f"Page: {question.get('page_number', 'N/A')}")
-                    with col2:
-                        st.caption(f"Number: {question.get('number', 'N/A')}")
-                    with col3:
-                        st.caption(f"Confidence: {question.get('confidence', 0):.2f}")
-            
-            # Export options
-            st.subheader("Export Results")
-            
-            col1, col2, col3, col4 = st.columns(4)
-            
-            exporter = Exporter()
-            
-            with col1:
-                if st.button("📄 Export as LaTeX"):
-                    latex_content = exporter.export_latex(results['questions'])
-                    st.download_button(
-                        label="Download LaTeX",
-                        data=latex_content,
-                        file_name=f"questions_{results['chapter']}_{results['topic']}.tex",
-                        mime="text/plain"
-                    )
-            
-            with col2:
-                if st.button("📝 Export as Markdown"):
-                    md_content = exporter.export_markdown(results['questions'])
-                    st.download_button(
-                        label="Download Markdown",
-                        data=md_content,
-                        file_name=f"questions_{results['chapter']}_{results['topic']}.md",
-                        mime="text/markdown"
-                    )
-            
-            with col3:
-                if st.button("📊 Export as JSON"):
-                    json_content = exporter.export_json(results['questions'])
-                    st.download_button(
-                        label="Download JSON",
-                        data=json_content,
-                        file_name=f"questions_{results['chapter']}_{results['topic']}.json",
-                        mime="application/json"
-                    )
-            
-            with col4:
-                if st.button("📑 Export as PDF"):
-                    # This would require LaTeX compilation
-                    st.info("PDF export requires LaTeX installation")
\ No newline at end of file
+            results_fragment(st.session_state['extraction_results'])
\ No newline at end of file
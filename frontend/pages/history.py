@@ -7,36 +7,55 @@ from datetime import datetime
 
 from src.utils.file_handler import FileHandler
 
+@st.cache_data(show_spinner=False)
+def load_history(mtime: float, path: str):
+    """Parse and bucket history, cached per file version
+
+    Args:
+        mtime: File modification time (cache key only)
+        path: Path to the history JSON file
+
+    Returns:
+        Tuple of (full history list, chapter -> entries mapping)
+    """
+    history = FileHandler().load_json(Path(path))
+
+    by_chapter = {}
+    for entry in history:
+        by_chapter.setdefault(entry.get('chapter', ''), []).append(entry)
+
+    return history, by_chapter
+
 def history_page():
     """Render history page"""
-    
+
     st.header("Extraction History")
-    
+
     # Load history
     history_file = Path("data/cache/history.json")
-    
+
     if history_file.exists():
-        file_handler = FileHandler()
-        history = file_handler.load_json(history_file)
-        
+        # Re-parsed only when the file changes on disk
+        history, by_chapter = load_history(
+            history_file.stat().st_mtime, str(history_file)
+        )
+
         # Filter options
         col1, col2 = st.columns(2)
-        
+
         with col1:
             date_filter = st.date_input("Filter by Date")
-        
+
         with col2:
             chapter_filter = st.selectbox(
                 "Filter by Chapter",
-                ["All"] + list(set(h.get('chapter', '') for h in history))
+                ["All"] + list(by_chapter.keys())
             )
-        
-        # Display history
-        for entry in reversed(history):
-            # Apply filters
-            if chapter_filter != "All" and entry.get('chapter') != chapter_filter:
-                continue
-            
+
+        # Display history (filtering is a dict lookup, not a scan)
+        entries = history if chapter_filter == "All" else by_chapter[chapter_filter]
+
+        for entry in reversed(entries):
             with st.expander(
                 f"{entry['timestamp']} - Chapter {entry['chapter']}, Topic {entry['topic']}"
             ):
@@ -3,9 +3,39 @@
 import streamlit as st
 from pathlib import Path
 import os
+import re
+import shutil
+import tempfile
+import threading
 
 from src.core.config import get_config
 
+def _fast_clear(root: Path):
+    """Remove the contents of a directory, keeping the directory itself
+
+    Uses os.scandir so plain files are unlinked without the per-entry
+    stat() that shutil.rmtree does, and tolerates concurrent writers.
+
+    Args:
+        root: Directory to empty
+    """
+    for entry in os.scandir(root):
+        if entry.is_dir(follow_symlinks=False):
+            shutil.rmtree(entry.path, ignore_errors=True)
+        else:
+            try:
+                os.unlink(entry.path)
+            except OSError:
+                pass
+
+def _clear_in_background(root: Path):
+    """Empty a directory on a daemon thread so the UI stays responsive
+
+    Args:
+        root: Directory to empty
+    """
+    threading.Thread(target=_fast_clear, args=(root,), daemon=True).start()
+
 def settings_page():
     """Render settings page"""
     
@@ -24,23 +54,30 @@ def settings_page():
     )
     
     if st.button("Save API Key"):
-        # Save to .env file
+        # Save to .env file: one C-level regex scan instead of a
+        # Python split/loop/join, then an atomic replace so a crash
+        # can't leave a half-written .env behind
         env_file = Path(".env")
         env_content = env_file.read_text() if env_file.exists() else ""
-        
-        if "GEMINI_API_KEY" in env_content:
-            # Update existing key
-            lines = env_content.split('\n')
-            for i, line in enumerate(lines):
-                if line.startswith("GEMINI_API_KEY"):
-                    lines[i] = f"GEMINI_API_KEY={api_key}"
-                    break
-            env_content = '\n'.join(lines)
-        else:
-            # Add new key
-            env_content += f"\nGEMINI_API_KEY={api_key}"
-        
-        env_file.write_text(env_content)
+
+        new_content, replaced = re.subn(
+            r'^GEMINI_API_KEY=.*$',
+            f'GEMINI_API_KEY={api_key}',
+            env_content,
+            count=1,
+            flags=re.MULTILINE
+        )
+
+        if replaced == 0:
+            new_content = env_content.rstrip('\n')
+            new_content += f"\nGEMINI_API_KEY={api_key}\n" if new_content else f"GEMINI_API_KEY={api_key}\n"
+
+        with tempfile.NamedTemporaryFile(
+            'w', dir=env_file.parent, delete=False, encoding='utf-8'
+        ) as tmp:
+            tmp.write(new_content)
+
+        os.replace(tmp.name, env_file)
         st.success("API key saved!")
     
     # Processing Settings
@@ -125,16 +162,12 @@ def settings_page():
         if st.button("Clear Cache"):
             cache_dir = Path(config.cache_dir)
             if cache_dir.exists():
-                import shutil
-                shutil.rmtree(cache_dir)
-                cache_dir.mkdir(parents=True, exist_ok=True)
-                st.success("Cache cleared!")
-    
+                _clear_in_background(cache_dir)
+                st.toast("Clearing cache in background")
+
     with col2:
         if st.button("Clear Vector Store"):
             vector_store_path = Path(config.vector_store_path)
             if vector_store_path.exists():
-                import shutil
-                shutil.rmtree(vector_store_path)
-                vector_store_path.mkdir(parents=True, exist_ok=True)
-                st.success("Vector store cleared!")
\ No newline at end of file
+                _clear_in_background(vector_store_path)
+                st.toast("Clearing vector store in background")
\ No newline at end of file
@@ -1,73 +1,102 @@
 """Configuration management for the application"""
 
+import functools
 import os
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional, Dict, Any
 from dotenv import load_dotenv
-from pydantic import Field
-from pydantic_settings import BaseSettings
 
-class Config(BaseSettings):
-    """Application configuration"""
-    
+def _env_str(name: str, default: str) -> str:
+    """Read a string setting from the environment"""
+    return os.getenv(name, default)
+
+def _env_int(name: str, default: int) -> int:
+    """Read an integer setting from the environment"""
+    return int(os.getenv(name, default))
+
+def _env_bool(name: str, default: bool) -> bool:
+    """Read a boolean setting from the environment"""
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+def _env_path(name: str, default: str) -> Path:
+    """Read a path setting from the environment"""
+    return Path(os.getenv(name, default))
+
+@dataclass(frozen=True)
+class Config:
+    """Application configuration
+
+    A lightweight frozen dataclass read straight from os.environ, so
+    importing config does not pull in a validation framework.
+    """
+
     # API Keys
-    gemini_api_key: str = Field(..., env="GEMINI_API_KEY")
-    
+    gemini_api_key: str = field(
+        default_factory=lambda: os.environ["GEMINI_API_KEY"])
+
     # Application Settings
-    log_level: str = Field("INFO", env="LOG_LEVEL")
-    cache_enabled: bool = Field(True, env="CACHE_ENABLED")
-    cache_dir: Path = Field(Path("./data/cache"), env="CACHE_DIR")
-    
+    log_level: str = field(
+        default_factory=lambda: _env_str("LOG_LEVEL", "INFO"))
+    cache_enabled: bool = field(
+        default_factory=lambda: _env_bool("CACHE_ENABLED", True))
+    cache_dir: Path = field(
+        default_factory=lambda: _env_path("CACHE_DIR", "./data/cache"))
+
     # Vector Store Settings
-    vector_store_path: Path = Field(Path("./data/vectorstore"), env="VECTOR_STORE_PATH")
-    embedding_model: str = Field("models/embedding-001", env="EMBEDDING_MODEL")
-    
+    vector_store_path: Path = field(
+        default_factory=lambda: _env_path("VECTOR_STORE_PATH", "./data/vectorstore"))
+    embedding_model: str = field(
+        default_factory=lambda: _env_str("EMBEDDING_MODEL", "models/embedding-001"))
+
     # Output Settings
-    output_dir: Path = Field(Path("./output"), env="OUTPUT_DIR")
-    default_export_format: str = Field("latex", env="DEFAULT_EXPORT_FORMAT")
-    
+    output_dir: Path = field(
+        default_factory=lambda: _env_path("OUTPUT_DIR", "./output"))
+    default_export_format: str = field(
+        default_factory=lambda: _env_str("DEFAULT_EXPORT_FORMAT", "latex"))
+
     # PDF Settings
-    max_pdf_size_mb: int = Field(100, env="MAX_PDF_SIZE_MB")
-    ocr_enabled: bool = Field(True, env="OCR_ENABLED")
-    ocr_language: str = Field("eng+hin", env="OCR_LANGUAGE")
-    
+    max_pdf_size_mb: int = field(
+        default_factory=lambda: _env_int("MAX_PDF_SIZE_MB", 100))
+    ocr_enabled: bool = field(
+        default_factory=lambda: _env_bool("OCR_ENABLED", True))
+    ocr_language: str = field(
+        default_factory=lambda: _env_str("OCR_LANGUAGE", "eng+hin"))
+    ocr_dpi: int = field(
+        default_factory=lambda: _env_int("OCR_DPI", 200))
+
     # RAG Settings
-    chunk_size: int = Field(1000, env="CHUNK_SIZE")
-    chunk_overlap: int = Field(200, env="CHUNK_OVERLAP")
-    top_k_retrieval: int = Field(5, env="TOP_K_RETRIEVAL")
-    
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-    
-    def __init__(self, **kwargs):
-        # Load environment variables
-        load_dotenv()
-        super().__init__(**kwargs)
-        
-        # Create directories if they don't exist
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
-        self.vector_store_path.mkdir(parents=True, exist_ok=True)
-        self.output_dir.mkdir(parents=True, exist_ok=True)
-    
+    chunk_size: int = field(
+        default_factory=lambda: _env_int("CHUNK_SIZE", 1000))
+    chunk_overlap: int = field(
+        default_factory=lambda: _env_int("CHUNK_OVERLAP", 200))
+    top_k_retrieval: int = field(
+        default_factory=lambda: _env_int("TOP_K_RETRIEVAL", 5))
+
     def get_output_path(self, filename: str, format: str = None) -> Path:
         """Get output path for a specific format"""
         format = format or self.default_export_format
         format_dir = self.output_dir / format
         format_dir.mkdir(parents=True, exist_ok=True)
         return format_dir / filename
-    
+
     @property
     def max_pdf_size_bytes(self) -> int:
         """Get max PDF size in bytes"""
         return self.max_pdf_size_mb * 1024 * 1024
 
-# Singleton instance
-_config_instance: Optional[Config] = None
+@functools.cache
+def _ensure_dirs(*dirs: Path):
+    """Create application directories once per process"""
+    for path in dirs:
+        path.mkdir(parents=True, exist_ok=True)
 
+@functools.cache
 def get_config() -> Config:
     """Get or create config instance"""
-    global _config_instance
-    if _config_instance is None:
-        _config_instance = Config()
-    return _config_instance
\ No newline at end of file
+    load_dotenv()
+    config = Config()
+    _ensure_dirs(config.cache_dir, config.vector_store_path, config.output_dir)
+    return config
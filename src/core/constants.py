@@ -1,9 +1,16 @@
 """Project constants"""
 
+import re
 from enum import Enum
 
-class QuestionType(Enum):
-    """Types of questions in RD Sharma"""
+class QuestionType(str, Enum):
+    """Types of questions in RD Sharma
+
+    The str mixin makes members compare and hash as plain strings, so
+    lookups against stored question dicts need no .value attribute
+    loads (stdlib StrEnum needs Python 3.11; the mixin behaves the
+    same on the 3.10 the Docker image runs).
+    """
     ILLUSTRATION = "illustration"
     EXERCISE = "exercise"
     EXAMPLE = "example"
@@ -11,13 +18,16 @@ class QuestionType(Enum):
     OBJECTIVE = "objective"
     SUBJECTIVE = "subjective"
 
-class ExportFormat(Enum):
+class ExportFormat(str, Enum):
     """Supported export formats"""
     LATEX = "latex"
     MARKDOWN = "markdown"
     JSON = "json"
     PDF = "pdf"
 
+# Frozen set for O(1) membership tests on the hot filter path
+QUESTION_TYPES_SET = frozenset(QuestionType)
+
 # Chapter mappings for RD Sharma Class 12
 CHAPTER_TOPICS = {
     30: {
@@ -37,6 +47,23 @@ CHAPTER_TOPICS = {
     # Add more chapters as needed
 }
 
+# Immutable option tuples and precomputed widget labels so UI reruns
+# reuse them instead of re-traversing CHAPTER_TOPICS
+CHAPTERS = tuple(CHAPTER_TOPICS.keys())
+CHAPTER_TOPIC_KEYS = {
+    chapter: tuple(info["topics"].keys())
+    for chapter, info in CHAPTER_TOPICS.items()
+}
+CHAPTER_LABELS = {
+    chapter: f"Chapter {chapter}: {info['name']}"
+    for chapter, info in CHAPTER_TOPICS.items()
+}
+TOPIC_LABELS = {
+    topic: f"{topic}: {name}"
+    for info in CHAPTER_TOPICS.values()
+    for topic, name in info["topics"].items()
+}
+
 # LaTeX math delimiters
 LATEX_DELIMITERS = {
     "inline": ("$", "$"),
@@ -55,6 +82,13 @@ QUESTION_PATTERNS = [
     r"^Problem",  # Problem statements
 ]
 
+# Single alternation compiled once at import: one regex match per line
+# instead of looping over the individual patterns
+QUESTION_PATTERN_RE = re.compile(
+    "|".join(f"(?:{pattern})" for pattern in QUESTION_PATTERNS),
+    re.MULTILINE
+)
+
 # Mathematical symbols mapping
 MATH_SYMBOLS = {
     "α": r"\alpha",
@@ -83,4 +117,22 @@ MATH_SYMBOLS = {
     "∩": r"\cap",
     "∀": r"\forall",
     "∃": r"\exists",
-}
\ No newline at end of file
+}
+
+# Precompiled single-pass replacers for MATH_SYMBOLS: one C-level scan
+# of the text instead of one str.replace() pass per symbol
+MATH_SYMBOLS_RE = re.compile(
+    "|".join(map(re.escape, sorted(MATH_SYMBOLS, key=len, reverse=True)))
+)
+MATH_SYMBOLS_TRANS = str.maketrans(MATH_SYMBOLS)
+
+def replace_math_symbols(text: str) -> str:
+    """Replace unicode math symbols with LaTeX macros in a single pass
+
+    Args:
+        text: Text containing unicode math symbols
+
+    Returns:
+        Text with symbols replaced by LaTeX commands
+    """
+    return MATH_SYMBOLS_RE.sub(lambda m: MATH_SYMBOLS[m.group(0)], text)
\ No newline at end of file
@@ -0,0 +1,38 @@
+"""Shared data models"""
+
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+@dataclass(slots=True, frozen=True)
+class Question:
+    """A question normalized for output formatting
+
+    The latex fallback (latex -> text -> empty) is resolved once at
+    construction, so formatters do plain attribute access instead of
+    chained dict .get lookups per question per format. Slots keep
+    instances lean for large question lists.
+    """
+    text: str
+    latex: str
+    number: Optional[str] = None
+    page_number: Optional[int] = None
+    parts: Tuple[str, ...] = ()
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Question":
+        """Build a Question from a pipeline question dictionary
+
+        Args:
+            data: Question dictionary
+
+        Returns:
+            Normalized Question
+        """
+        text = data.get('text') or data.get('original_text') or ''
+        return cls(
+            text=text,
+            latex=data.get('latex') or text,
+            number=data.get('number'),
+            page_number=data.get('page_number'),
+            parts=tuple(data.get('parts') or ()),
+        )
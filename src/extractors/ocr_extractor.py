@@ -1,8 +1,12 @@
 """OCR extraction for scanned PDFs"""
 
 import logging
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import pytesseract
 from PIL import Image
 import pdf2image
@@ -12,6 +16,187 @@ import numpy as np
 from .base_extractor import BaseExtractor
 from ..core.exceptions import OCRError
 from ..core.config import get_config
+from ..utils.file_handler import FileHandler
+from ..utils.helpers import file_digest
+
+# tesserocr keeps one in-process Tesseract API alive instead of forking
+# the binary (and reloading the LSTM model) for every page; fall back to
+# pytesseract where it isn't installed
+try:
+    from tesserocr import PyTessBaseAPI, PSM, OEM
+    _HAS_TESSEROCR = True
+except ImportError:
+    _HAS_TESSEROCR = False
+
+# Per-process persistent API handle (one per pool worker)
+_worker_api = None
+
+# Shared structuring element for binary denoising
+_DENOISE_KERNEL = cv2.getStructuringElement(cv2.MORPH_RECT, (3, 3))
+
+def _get_worker_api(lang: str) -> "PyTessBaseAPI":
+    """Get or create this process's persistent Tesseract API handle
+
+    Args:
+        lang: Tesseract language string
+
+    Returns:
+        Initialized PyTessBaseAPI
+    """
+    global _worker_api
+    if _worker_api is None:
+        _worker_api = PyTessBaseAPI(
+            lang=lang, psm=PSM.SINGLE_BLOCK, oem=OEM.LSTM_ONLY
+        )
+    return _worker_api
+
+def _preprocess_image(image: Image.Image) -> Image.Image:
+    """Preprocess image for better OCR
+
+    Module-level so worker processes can run it without an extractor
+    instance. Returns a PIL image (mode 'L', zero-copy view of the
+    processed array) since that is what both Tesseract front-ends
+    consume — handing them a raw array forces a conversion per page.
+
+    Args:
+        image: PIL Image
+
+    Returns:
+        Preprocessed grayscale PIL image
+    """
+    # Convert to numpy array
+    img_array = np.array(image)
+
+    # Convert to grayscale if needed
+    if len(img_array.shape) == 3:
+        gray = cv2.cvtColor(img_array, cv2.COLOR_RGB2GRAY)
+    else:
+        gray = img_array
+
+    # Apply thresholding
+    _, thresh = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+
+    # Denoise. On an already-binarized image a 3x3 morphological open
+    # removes speckle like the median filter did but runs erode+dilate,
+    # which are cheaper than per-pixel neighborhood sorting
+    denoised = cv2.morphologyEx(thresh, cv2.MORPH_OPEN, _DENOISE_KERNEL)
+
+    # Deskew
+    deskewed = _deskew(denoised)
+
+    return Image.fromarray(deskewed, mode='L')
+
+def _deskew(image: np.ndarray) -> np.ndarray:
+    """Deskew image
+
+    The skew angle is estimated on a 4x-downsampled view, so the
+    foreground-coordinate array is ~16x smaller (and float32 rather
+    than int64); the rotation itself is applied at full resolution.
+
+    Args:
+        image: Image array
+
+    Returns:
+        Deskewed image
+    """
+    sampled = image[::4, ::4]
+    coords = np.column_stack(np.nonzero(sampled)).astype(np.float32)
+
+    if len(coords) == 0:
+        return image
+
+    angle = cv2.minAreaRect(coords)[-1]
+
+    if angle < -45:
+        angle = -(90 + angle)
+    else:
+        angle = -angle
+
+    # Most scans are already straight; when the estimated skew is
+    # negligible, skip the full-resolution warp (the expensive step —
+    # INTER_CUBIC resampling of the whole page) and the quality loss
+    # that comes with resampling
+    if abs(angle) < 0.25:
+        return image
+
+    (h, w) = image.shape[:2]
+    center = (w // 2, h // 2)
+    M = cv2.getRotationMatrix2D(center, angle, 1.0)
+    rotated = cv2.warpAffine(
+        image, M, (w, h),
+        flags=cv2.INTER_CUBIC,
+        borderMode=cv2.BORDER_REPLICATE
+    )
+
+    return rotated
+
+def _text_from_data(data: Dict) -> str:
+    """Rebuild page text from image_to_data word boxes
+
+    Words are grouped by (block, paragraph, line) and lines joined with
+    newlines, approximating image_to_string's layout.
+
+    Args:
+        data: image_to_data DICT output
+
+    Returns:
+        Reconstructed page text
+    """
+    lines = {}
+
+    for i, word in enumerate(data['text']):
+        if not word.strip():
+            continue
+        key = (data['block_num'][i], data['par_num'][i], data['line_num'][i])
+        lines.setdefault(key, []).append(word)
+
+    return '\n'.join(' '.join(words) for _, words in sorted(lines.items()))
+
+def _ocr_one_page(page: Tuple[int, str], lang: str, cfg: str) -> Dict:
+    """OCR a single rasterized page
+
+    Top-level (not a method) so ProcessPoolExecutor workers can pickle
+    the task; pages are handed over as file paths to keep IPC payloads
+    small. A single image_to_data pass yields both the text and the
+    confidences, instead of separate image_to_string / image_to_data /
+    hocr invocations that each rerun Tesseract on the same bitmap.
+
+    Args:
+        page: (page_number, image_path) pair
+        lang: Tesseract language string
+        cfg: Tesseract config string
+
+    Returns:
+        Page dictionary with text and confidence
+    """
+    page_number, image_path = page
+
+    image = Image.open(image_path)
+    processed_image = _preprocess_image(image)
+
+    if _HAS_TESSEROCR:
+        api = _get_worker_api(lang)
+        api.SetImage(processed_image)
+        text = api.GetUTF8Text()
+        confidences = [c for c in api.AllWordConfidences() if c > 0]
+    else:
+        data = pytesseract.image_to_data(
+            processed_image,
+            lang=lang,
+            config=cfg,
+            output_type=pytesseract.Output.DICT
+        )
+        text = _text_from_data(data)
+        confidences = np.asarray(data['conf'], dtype=np.float32)
+        confidences = confidences[confidences > 0]
+
+    confidence = float(np.mean(confidences)) if len(confidences) else 0.0
+
+    return {
+        "page_number": page_number,
+        "text": text,
+        "confidence": confidence
+    }
 
 class OCRExtractor(BaseExtractor):
     """Extract text from images using OCR"""
@@ -22,8 +207,9 @@ class OCRExtractor(BaseExtractor):
         self.config = get_config()
         self.logger = logging.getLogger(__name__)
         
-        # Configure tesseract
-        self.tesseract_config = r'--oem 3 --psm 6'
+        # Configure tesseract. Passing --dpi makes Tesseract trust the
+        # rasterization DPI and skip its autoscale pass
+        self.tesseract_config = rf'--oem 3 --psm 6 --dpi {self.config.ocr_dpi}'
         self.language = self.config.ocr_language
     
     def validate_source(self, source: Path) -> bool:
@@ -58,17 +244,51 @@ class OCRExtractor(BaseExtractor):
         """
         if not self.validate_source(source):
             raise OCRError(f"Invalid source for OCR: {source}")
-        
+
         source = Path(source)
-        
+
+        # OCR is by far the slowest extraction path, so its results are
+        # cached on disk keyed by content digest plus the OCR settings
+        # that shape the output
+        cache_path = self._cache_path(source)
+        if cache_path is not None and cache_path.exists():
+            try:
+                return FileHandler.load_pickle(cache_path)
+            except Exception as e:
+                self.logger.warning(f"Ignoring unreadable OCR cache: {e}")
+
         try:
             if source.suffix.lower() == '.pdf':
-                return self._extract_from_pdf(source)
+                result = self._extract_from_pdf(source)
             else:
-                return self._extract_from_image(source)
+                result = self._extract_from_image(source)
         except Exception as e:
             self.logger.error(f"OCR extraction failed: {e}")
             raise OCRError(f"OCR extraction failed: {e}")
+
+        if cache_path is not None:
+            try:
+                FileHandler.save_pickle(result, cache_path)
+            except Exception as e:
+                self.logger.warning(f"Failed to write OCR cache: {e}")
+
+        return result
+
+    def _cache_path(self, source: Path) -> Optional[Path]:
+        """Get the disk-cache path for a source's OCR result
+
+        Args:
+            source: Path to source file
+
+        Returns:
+            Cache file path, or None when caching is disabled
+        """
+        if not self.config.cache_enabled:
+            return None
+
+        digest = file_digest(source)
+        key = f"ocr_{digest}_{self.language}_{self.config.ocr_dpi}"
+        return self.config.cache_dir / f"{key}.pkl"
     
     def _extract_from_pdf(self, pdf_path: Path) -> Dict:
         """Extract text from PDF using OCR
@@ -79,43 +299,43 @@ class OCRExtractor(BaseExtractor):
         Returns:
             Extracted content
         """
-        # Convert PDF to images
-        images = pdf2image.convert_from_path(pdf_path, dpi=300)
-        
-        pages = []
-        for i, image in enumerate(images, 1):
-            # Preprocess image
-            processed_image = self._preprocess_image(image)
-            
-            # Extract text
-            text = pytesseract.image_to_string(
-                processed_image,
-                lang=self.language,
-                config=self.tesseract_config
-            )
-            
-            # Also extract with layout preservation
-            hocr = pytesseract.image_to_pdf_or_hocr(
-                processed_image,
-                lang=self.language,
-                extension='hocr'
+        # Single-threaded tesseract workers in parallel beat its internal
+        # OpenMP threading, so pin OMP and fan pages out across cores
+        os.environ.setdefault('OMP_THREAD_LIMIT', '1')
+
+        # Convert PDF to images. thread_count fans the poppler rendering
+        # out across cores (output_folder is required for that to take
+        # effect and keeps decoded bitmaps out of RAM). Tesseract cost
+        # scales with pixel count, so rasterize at the configured DPI
+        # rather than a fixed 300
+        with tempfile.TemporaryDirectory() as tmpdir:
+            image_paths = pdf2image.convert_from_path(
+                pdf_path,
+                dpi=self.config.ocr_dpi,
+                thread_count=max(1, os.cpu_count() or 1),
+                output_folder=tmpdir,
+                fmt='png',
+                paths_only=True
             )
-            
-            pages.append({
-                "page_number": i,
-                "text": text,
-                "hocr": hocr,
-                "confidence": self._get_confidence(processed_image)
-            })
-            
-            self.logger.info(f"OCR completed for page {i}/{len(images)}")
-        
+
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                pages = list(executor.map(
+                    partial(
+                        _ocr_one_page,
+                        lang=self.language,
+                        cfg=self.tesseract_config
+                    ),
+                    enumerate(image_paths, 1)
+                ))
+
+        self.logger.info(f"OCR completed for {len(pages)} pages")
+
         return {
             "pages": pages,
             "total_pages": len(pages),
             "extraction_method": "OCR"
         }
-    
+
     def _extract_from_image(self, image_path: Path) -> Dict:
         """Extract text from image
         
@@ -126,102 +346,20 @@ class OCRExtractor(BaseExtractor):
             Extracted text
         """
         image = Image.open(image_path)
-        processed_image = self._preprocess_image(image)
-        
+        processed_image = _preprocess_image(image)
+
         text = pytesseract.image_to_string(
             processed_image,
             lang=self.language,
             config=self.tesseract_config
         )
-        
+
         return {
             "text": text,
             "source": str(image_path),
             "extraction_method": "OCR"
         }
-    
-    def _preprocess_image(self, image: Image.Image) -> np.ndarray:
-        """Preprocess image for better OCR
-        
-        Args:
-            image: PIL Image
-            
-        Returns:
-            Preprocessed image array
-        """
-        # Convert to numpy array
-        img_array = np.array(image)
-        
-        # Convert to grayscale if needed
-        if len(img_array.shape) == 3:
-            gray = cv2.cvtColor(img_array, cv2.COLOR_RGB2GRAY)
-        else:
-            gray = img_array
-        
-        # Apply thresholding
-        _, thresh = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
-        
-        # Denoise
-        denoised = cv2.medianBlur(thresh, 3)
-        
-        # Deskew
-        deskewed = self._deskew(denoised)
-        
-        return deskewed
-    
-    def _deskew(self, image: np.ndarray) -> np.ndarray:
-        """Deskew image
-        
-        Args:
-            image: Image array
-            
-        Returns:
-            Deskewed image
-        """
-        coords = np.column_stack(np.where(image > 0))
-        
-        if len(coords) == 0:
-            return image
-        
-        angle = cv2.minAreaRect(coords)[-1]
-        
-        if angle < -45:
-            angle = -(90 + angle)
-        else:
-            angle = -angle
-        
-        (h, w) = image.shape[:2]
-        center = (w // 2, h // 2)
-        M = cv2.getRotationMatrix2D(center, angle, 1.0)
-        rotated = cv2.warpAffine(
-            image, M, (w, h),
-            flags=cv2.INTER_CUBIC,
-            borderMode=cv2.BORDER_REPLICATE
-        )
-        
-        return rotated
-    
-    def _get_confidence(self, image: np.ndarray) -> float:
-        """Get OCR confidence score
-        
-        Args:
-            image: Image array
-            
-        Returns:
-            Confidence score
-        """
-        data = pytesseract.image_to_data(
-            image,
-            output_type=pytesseract.Output.DICT
-        )
-        
-        confidences = [int(conf) for conf in data['conf'] if int(conf) > 0]
-        
-        if confidences:
-            return sum(confidences) / len(confidences)
-        
-        return 0.0
-    
+
     def extract_math_regions(self, image: Image.Image) -> List[Dict]:
         """Extract mathematical regions from image
         
@@ -233,21 +371,26 @@ class OCRExtractor(BaseExtractor):
         """
         img_array = np.array(image)
         gray = cv2.cvtColor(img_array, cv2.COLOR_RGB2GRAY)
-        
-        # Find contours that might be mathematical expressions
-        edges = cv2.Canny(gray, 50, 150)
-        contours, _ = cv2.findContours(edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-        
+
+        # Label connected foreground components in one pass on a 2x
+        # downsampled binary view. connectedComponentsWithStats returns
+        # every bounding box at once, so there is no per-contour Python
+        # loop over Canny edges; boxes are scaled back to full resolution
+        # before cropping
+        small = gray[::2, ::2]
+        _, binary = cv2.threshold(
+            small, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU
+        )
+        num_labels, _, stats, _ = cv2.connectedComponentsWithStats(binary)
+
         math_regions = []
-        for contour in contours:
-            x, y, w, h = cv2.boundingRect(contour)
-            
-            # Filter based on size and aspect ratio
+        # Label 0 is the background; filter based on size at full scale
+        for x, y, w, h, _ in stats[1:] * 2:
             if w > 30 and h > 20:
                 region = img_array[y:y+h, x:x+w]
                 math_regions.append({
-                    "bbox": (x, y, w, h),
+                    "bbox": (int(x), int(y), int(w), int(h)),
                     "image": region
                 })
-        
+
         return math_regions
\ No newline at end of file
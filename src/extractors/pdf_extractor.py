@@ -1,6 +1,9 @@
 """PDF text extraction module"""
 
 import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 import fitz  # PyMuPDF
@@ -10,6 +13,8 @@ from PyPDF2 import PdfReader
 from .base_extractor import BaseExtractor
 from ..core.exceptions import PDFProcessingError
 from ..core.config import get_config
+from ..utils.file_handler import FileHandler
+from ..utils.helpers import file_digest
 
 class PDFExtractor(BaseExtractor):
     """Extract text from PDF files"""
@@ -65,8 +70,19 @@ class PDFExtractor(BaseExtractor):
         """
         if not self.validate_source(source):
             raise PDFProcessingError(f"Invalid PDF source: {source}")
-        
+
         source = Path(source)
+
+        # Re-extracting the same file is pure waste: results are cached
+        # on disk keyed by content digest, so renamed or re-uploaded
+        # copies of a PDF still hit
+        cache_path = self._cache_path(source)
+        if cache_path is not None and cache_path.exists():
+            try:
+                return FileHandler.load_pickle(cache_path)
+            except Exception as e:
+                self.logger.warning(f"Ignoring unreadable extraction cache: {e}")
+
         extracted_data = {
             "filename": source.name,
             "pages": [],
@@ -94,34 +110,79 @@ class PDFExtractor(BaseExtractor):
         except Exception as e:
             self.logger.error(f"Error extracting PDF: {e}")
             raise PDFProcessingError(f"Failed to extract PDF: {e}")
-        
-        return self.postprocess(extracted_data)
-    
+
+        result = self.postprocess(extracted_data)
+
+        if cache_path is not None:
+            try:
+                FileHandler.save_pickle(result, cache_path)
+            except Exception as e:
+                self.logger.warning(f"Failed to write extraction cache: {e}")
+
+        return result
+
+    def _cache_path(self, source: Path) -> Optional[Path]:
+        """Get the disk-cache path for a PDF's extraction result
+
+        Args:
+            source: Path to PDF file
+
+        Returns:
+            Cache file path, or None when caching is disabled
+        """
+        if not self.config.cache_enabled:
+            return None
+
+        digest = file_digest(source)
+        return self.config.cache_dir / f"extract_{digest}_{int(self.use_ocr)}.pkl"
+
     def _extract_with_pymupdf(self, pdf_path: Path) -> Dict:
         """Extract using PyMuPDF
-        
+
         Args:
             pdf_path: Path to PDF
-            
+
         Returns:
             Extracted content
         """
         doc = fitz.open(pdf_path)
-        pages = []
-        
-        for page_num, page in enumerate(doc, 1):
-            text = page.get_text()
-            pages.append({
-                "page_number": page_num,
-                "text": text,
+        try:
+            page_count = doc.page_count
+            metadata = doc.metadata
+        finally:
+            doc.close()
+
+        # MuPDF releases the GIL during text/image extraction, so pages
+        # parallelize well across threads — but a fitz.Document is not
+        # thread-safe, so each worker pins its own open handle via
+        # threading.local instead of sharing one
+        local = threading.local()
+        handles = []
+
+        def worker_doc():
+            worker = getattr(local, 'doc', None)
+            if worker is None:
+                worker = local.doc = fitz.open(pdf_path)
+                handles.append(worker)
+            return worker
+
+        def extract_page(page_num: int) -> Dict:
+            page = worker_doc().load_page(page_num)
+            return {
+                "page_number": page_num + 1,
+                "text": page.get_text(),
                 "bbox": page.rect,
                 "images": len(page.get_images()),
                 "tables": self._extract_tables_from_page(page)
-            })
-        
-        metadata = doc.metadata
-        doc.close()
-        
+            }
+
+        try:
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                pages = list(executor.map(extract_page, range(page_count)))
+        finally:
+            for handle in handles:
+                handle.close()
+
         return {
             "pages": pages,
             "metadata": metadata,
@@ -184,15 +245,19 @@ class PDFExtractor(BaseExtractor):
         """
         if not content.get("pages"):
             return True
-        
-        total_text = sum(len(p.get("text", "")) for p in content["pages"])
+
+        # Heuristic: if very little text but many images, likely scanned.
+        # Stop counting text as soon as the threshold is crossed — on a
+        # normal text PDF the first page or two already decides this
+        total_text = 0
+        for page in content["pages"]:
+            total_text += len(page.get("text", ""))
+            if total_text >= 500:
+                return False
+
         total_images = sum(p.get("images", 0) for p in content["pages"])
-        
-        # Heuristic: if very little text but many images, likely scanned
-        if total_text < 500 and total_images > len(content["pages"]):
-            return True
-        
-        return False
+
+        return total_images > len(content["pages"])
     
     def extract_chapter_topic(self, pdf_path: Path, chapter: int, topic: str) -> Dict:
         """Extract specific chapter and topic
@@ -205,33 +270,53 @@ class PDFExtractor(BaseExtractor):
         Returns:
             Extracted content for the topic
         """
-        full_content = self.extract(pdf_path)
-        
-        # Find pages containing the topic
-        topic_pages = []
-        topic_started = False
         next_topic = self._get_next_topic(chapter, topic)
-        
-        for page in full_content["pages"]:
-            text = page["text"]
-            
-            # Check if topic starts in this page
-            if topic in text and not topic_started:
-                topic_started = True
-            
-            # If topic has started, add page
-            if topic_started:
-                topic_pages.append(page)
-                
-                # Check if next topic starts (end of current topic)
-                if next_topic and next_topic in text:
+
+        # Locate the topic's page range with MuPDF's native text search
+        # before extracting anything, so only the handful of pages the
+        # topic spans pay for text and table extraction — not the whole
+        # book
+        doc = fitz.open(pdf_path)
+        try:
+            start_page = None
+            end_page = doc.page_count - 1
+
+            for page_num in range(doc.page_count):
+                page = doc.load_page(page_num)
+
+                if start_page is None:
+                    if page.search_for(topic):
+                        start_page = page_num
+                    else:
+                        continue
+
+                # The page where the next topic starts is still included,
+                # matching the page-level granularity of the old scan
+                if next_topic and page.search_for(next_topic):
+                    end_page = page_num
                     break
-        
+
+            topic_pages = []
+            if start_page is not None:
+                for page_num in range(start_page, end_page + 1):
+                    page = doc.load_page(page_num)
+                    topic_pages.append({
+                        "page_number": page_num + 1,
+                        "text": page.get_text(),
+                        "bbox": page.rect,
+                        "images": len(page.get_images()),
+                        "tables": self._extract_tables_from_page(page)
+                    })
+
+            metadata = doc.metadata
+        finally:
+            doc.close()
+
         return {
             "chapter": chapter,
             "topic": topic,
             "pages": topic_pages,
-            "metadata": full_content["metadata"]
+            "metadata": metadata
         }
     
     def _get_next_topic(self, chapter: int, current_topic: str) -> Optional[str]:
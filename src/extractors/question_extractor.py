@@ -2,13 +2,61 @@
 
 import re
 import logging
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Tuple
+from dataclasses import dataclass, field
+
+import numpy as np
 
 from .base_extractor import BaseExtractor
 from ..core.constants import QUESTION_PATTERNS, QuestionType
 from ..core.exceptions import ExtractionError
 
+# Compiled once at import: the extractor runs these against every line
+# of every page, and inline re.* calls pay a cache lookup per call
+_RE_WS = re.compile(r'\s+')
+_RE_PAGE = re.compile(r'Page \d+')
+_RE_RDSHARMA = re.compile(r'RD SHARMA.*?Class.*?\d+', re.IGNORECASE)
+
+# Single alternation so one scan answers "does this contain math?"
+_RE_MATH = re.compile('|'.join([
+    r'\d+[\+\-\*/]\d+',  # Basic operations
+    r'[xy]=',  # Equations
+    r'\\[a-zA-Z]+',  # LaTeX commands
+    r'[∫∑∏√]',  # Math symbols
+    r'\^',  # Exponents
+    r'_{',  # Subscripts
+    r'\\frac',  # Fractions
+    r'\\sqrt',  # Square roots
+    r'P\([^)]+\)',  # Probability notation
+]))
+
+# One linear scan over the block instead of ~20 substring searches
+# (plus the block.lower() copy each of them needed)
+_RE_QBLOCK = re.compile(
+    r'\?|\b(?:Find|Calculate|Prove|Show that|Determine|Evaluate|Solve'
+    r'|If|When|What|Which|How|Why|Verify|Derive|Explain|State|Define'
+    r'|Given)\b',
+    re.IGNORECASE
+)
+
+# All question-start shapes (numbered, Q-prefixed, section headers,
+# lettered sub-parts, roman numerals) folded into one MULTILINE regex so
+# block boundaries come from a single scan of the page text
+_RE_QSTART = re.compile(
+    r'^[ \t]*(?:'
+    + '|'.join(f"(?:{pattern.lstrip('^')})" for pattern in QUESTION_PATTERNS)
+    + r'|\([a-z]\)|[IVX]+\.)',
+    re.MULTILINE
+)
+
+_NUMBER_PATTERNS = [
+    re.compile(r'^(\d+)\.'),
+    re.compile(r'^Q(\d+)'),
+    re.compile(r'^Question (\d+)'),
+    re.compile(r'^\(([a-z])\)'),
+    re.compile(r'^([IVX]+)\.'),
+]
+
 @dataclass
 class Question:
     """Represents an extracted question"""
@@ -19,6 +67,89 @@ class Question:
     confidence: float = 1.0
     metadata: Dict = None
 
+# Question types indexed by a compact integer code
+_QUESTION_TYPE_CODES = {qt: i for i, qt in enumerate(QuestionType)}
+_QUESTION_TYPES_BY_CODE = tuple(QuestionType)
+
+@dataclass
+class QuestionBatch:
+    """Column-oriented collection of extracted questions
+
+    Stores one column per field instead of one object per question, so a
+    chapter's worth of questions lives in a handful of contiguous
+    buffers rather than thousands of small dataclass instances. The
+    numeric columns are exposed as compact NumPy arrays.
+    """
+    texts: List[str] = field(default_factory=list)
+    numbers: List[Optional[str]] = field(default_factory=list)
+    type_codes: List[int] = field(default_factory=list)
+    page_numbers: List[int] = field(default_factory=list)
+    confidences: List[float] = field(default_factory=list)
+
+    def append(self, question: Question):
+        """Append a question's fields to the columns
+
+        Args:
+            question: Question to add
+        """
+        self.texts.append(question.text)
+        self.numbers.append(question.number)
+        self.type_codes.append(_QUESTION_TYPE_CODES[question.question_type])
+        self.page_numbers.append(question.page_number or 0)
+        self.confidences.append(question.confidence)
+
+    @property
+    def types(self) -> np.ndarray:
+        """Question type codes as an int8 array"""
+        return np.asarray(self.type_codes, dtype=np.int8)
+
+    @property
+    def pages(self) -> np.ndarray:
+        """Page numbers as an int32 array (0 where unknown)"""
+        return np.asarray(self.page_numbers, dtype=np.int32)
+
+    @property
+    def confidence_scores(self) -> np.ndarray:
+        """Confidence scores as a float32 array"""
+        return np.asarray(self.confidences, dtype=np.float32)
+
+    def to_records(self) -> List[Dict]:
+        """Materialize the batch as per-question dictionaries
+
+        Returns:
+            List of question dictionaries
+        """
+        return [
+            {
+                "text": text,
+                "type": _QUESTION_TYPES_BY_CODE[code].value,
+                "number": number,
+                "page_number": page or None,
+                "confidence": confidence,
+            }
+            for text, number, code, page, confidence in zip(
+                self.texts, self.numbers, self.type_codes,
+                self.page_numbers, self.confidences
+            )
+        ]
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def __iter__(self) -> Iterator[Question]:
+        """Yield Question objects built on the fly from the columns"""
+        for text, number, code, page, confidence in zip(
+            self.texts, self.numbers, self.type_codes,
+            self.page_numbers, self.confidences
+        ):
+            yield Question(
+                text=text,
+                question_type=_QUESTION_TYPES_BY_CODE[code],
+                number=number,
+                page_number=page or None,
+                confidence=confidence
+            )
+
 class QuestionExtractor(BaseExtractor):
     """Extract and identify questions from text"""
     
@@ -26,16 +157,7 @@ class QuestionExtractor(BaseExtractor):
         """Initialize question extractor"""
         super().__init__()
         self.logger = logging.getLogger(__name__)
-        self.question_patterns = self._compile_patterns()
-    
-    def _compile_patterns(self) -> List[re.Pattern]:
-        """Compile regex patterns for question detection
-        
-        Returns:
-            List of compiled patterns
-        """
-        return [re.compile(pattern, re.MULTILINE) for pattern in QUESTION_PATTERNS]
-    
+
     def validate_source(self, source: str) -> bool:
         """Validate text source
         
@@ -81,49 +203,25 @@ class QuestionExtractor(BaseExtractor):
         Returns:
             List of text blocks
         """
-        # Split by double newlines or question patterns
+        # One MULTILINE scan finds every question-start position; blocks
+        # are then sliced between consecutive starts instead of testing
+        # each line against the pattern list
+        starts = [match.start() for match in _RE_QSTART.finditer(text)]
+
+        if not starts:
+            return [text] if text else []
+
         blocks = []
-        current_block = []
-        
-        lines = text.split('\n')
-        
-        for line in lines:
-            # Check if line starts a new question
-            if self._is_question_start(line):
-                if current_block:
-                    blocks.append('\n'.join(current_block))
-                current_block = [line]
-            else:
-                current_block.append(line)
-        
-        if current_block:
-            blocks.append('\n'.join(current_block))
-        
+
+        # Text before the first question start (headers, theory)
+        if starts[0] > 0:
+            blocks.append(text[:starts[0]])
+
+        for begin, end in zip(starts, starts[1:] + [len(text)]):
+            blocks.append(text[begin:end])
+
         return blocks
-    
-    def _is_question_start(self, line: str) -> bool:
-        """Check if line starts a question
-        
-        Args:
-            line: Text line
-            
-        Returns:
-            True if question start
-        """
-        line = line.strip()
-        
-        for pattern in self.question_patterns:
-            if pattern.match(line):
-                return True
-        
-        # Additional heuristics
-        if re.match(r'^\([a-z]\)', line):  # (a), (b), etc.
-            return True
-        if re.match(r'^[IVX]+\.', line):  # Roman numerals
-            return True
-        
-        return False
-    
+
     def _is_question_block(self, block: str) -> bool:
         """Determine if block contains a question
         
@@ -133,42 +231,10 @@ class QuestionExtractor(BaseExtractor):
         Returns:
             True if contains question
         """
-        # Check for question indicators
-        question_indicators = [
-            '?',  # Question mark
-            'Find',
-            'Calculate',
-            'Prove',
-            'Show that',
-            'Determine',
-            'Evaluate',
-            'Solve',
-            'If',
-            'When',
-            'What',
-            'Which',
-            'How',
-            'Why',
-            'Verify',
-            'Derive',
-            'Explain',
-            'State',
-            'Define',
-            'Given',
-        ]
-        
-        block_lower = block.lower()
-        
-        for indicator in question_indicators:
-            if indicator.lower() in block_lower:
-                return True
-        
-        # Check for mathematical content
-        if self._contains_math(block):
-            # Even without explicit question words, math content might be a problem
-            return True
-        
-        return False
+        # Check for question indicators, falling back to math content:
+        # even without explicit question words, math content might be a
+        # problem statement
+        return bool(_RE_QBLOCK.search(block)) or self._contains_math(block)
     
     def _contains_math(self, text: str) -> bool:
         """Check if text contains mathematical content
@@ -179,23 +245,7 @@ class QuestionExtractor(BaseExtractor):
         Returns:
             True if contains math
         """
-        math_indicators = [
-            r'\d+[\+\-\*/]\d+',  # Basic operations
-            r'[xy]=',  # Equations
-            r'\\[a-zA-Z]+',  # LaTeX commands
-            r'[∫∑∏√]',  # Math symbols
-            r'\^',  # Exponents
-            r'_{',  # Subscripts
-            r'\\frac',  # Fractions
-            r'\\sqrt',  # Square roots
-            r'P\([^)]+\)',  # Probability notation
-        ]
-        
-        for pattern in math_indicators:
-            if re.search(pattern, text):
-                return True
-        
-        return False
+        return bool(_RE_MATH.search(text))
     
     def _extract_question(self, block: str) -> Optional[Question]:
         """Extract question from block
@@ -235,12 +285,12 @@ class QuestionExtractor(BaseExtractor):
             Cleaned text
         """
         # Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text)
-        
+        text = _RE_WS.sub(' ', text)
+
         # Remove page numbers, headers, footers
-        text = re.sub(r'Page \d+', '', text)
-        text = re.sub(r'RD SHARMA.*?Class.*?\d+', '', text, flags=re.IGNORECASE)
-        
+        text = _RE_PAGE.sub('', text)
+        text = _RE_RDSHARMA.sub('', text)
+
         return text.strip()
     
     def _determine_question_type(self, text: str) -> QuestionType:
@@ -274,20 +324,11 @@ class QuestionExtractor(BaseExtractor):
         Returns:
             Question number or None
         """
-        # Try different number patterns
-        patterns = [
-            r'^(\d+)\.',
-            r'^Q(\d+)',
-            r'^Question (\d+)',
-            r'^\(([a-z])\)',
-            r'^([IVX]+)\.',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text)
+        for pattern in _NUMBER_PATTERNS:
+            match = pattern.search(text)
             if match:
                 return match.group(1)
-        
+
         return None
     
     def _calculate_confidence(self, text: str) -> float:
@@ -318,27 +359,26 @@ class QuestionExtractor(BaseExtractor):
         
         return min(score, 1.0)
     
-    def extract_from_pages(self, pages: List[Dict]) -> List[Question]:
+    def extract_from_pages(self, pages: List[Dict]) -> QuestionBatch:
         """Extract questions from multiple pages
-        
+
         Args:
             pages: List of page dictionaries
-            
+
         Returns:
-            List of questions
+            Batch of questions (iterable as Question objects)
         """
-        all_questions = []
-        
+        batch = QuestionBatch()
+
         for page in pages:
             page_text = page.get("text", "")
             page_number = page.get("page_number")
-            
+
             questions = self.extract(page_text)
-            
+
             # Add page number to questions
             for question in questions:
                 question.page_number = page_number
-            
-            all_questions.extend(questions)
-        
-        return all_questions
\ No newline at end of file
+                batch.append(question)
+
+        return batch
\ No newline at end of file
@@ -0,0 +1,140 @@
+"""Request-coalescing wrapper around GeminiClient"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import List
+
+from .gemini_client import GeminiClient
+
+@dataclass
+class _PendingRequest:
+    """A submitted text waiting to be batched"""
+    text: str
+    operation: str
+    future: asyncio.Future
+
+class BatchedLLMClient:
+    """Coalesce per-question LLM calls into multi-prompt batches
+
+    Callers submit texts one at a time as the pipeline produces them; a
+    drain loop gathers whatever arrives within a small window (or until
+    the batch is full) and dispatches each operation group as a single
+    combined prompt, amortizing per-request overhead across the batch.
+    Groups are binned by cumulative length so one oversized text never
+    holds a whole batch hostage.
+    """
+
+    def __init__(self, client: GeminiClient = None,
+                 window: float = 0.2, max_batch: int = 32):
+        """Initialize batched client
+
+        Args:
+            client: Underlying Gemini client (created if omitted)
+            window: Seconds to wait for more requests before dispatching
+            max_batch: Dispatch immediately once this many are queued
+        """
+        self.client = client or GeminiClient()
+        self.window = window
+        self.max_batch = max_batch
+        self.logger = logging.getLogger(__name__)
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._drain_task = None
+
+    async def submit(self, text: str, operation: str):
+        """Submit one text; resolves when its batch has been processed
+
+        Args:
+            text: Input text
+            operation: Operation to perform (extract/latex/type)
+
+        Returns:
+            Result for this text (None on failure)
+        """
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put(_PendingRequest(text, operation, future))
+
+        if self._drain_task is None or self._drain_task.done():
+            self._drain_task = asyncio.create_task(self._drain())
+
+        return await future
+
+    async def _drain(self):
+        """Drain the queue in windowed batches until it runs dry"""
+        loop = asyncio.get_running_loop()
+
+        while not self._queue.empty():
+            batch = [self._queue.get_nowait()]
+            deadline = loop.time() + self.window
+
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(
+                        await asyncio.wait_for(self._queue.get(), timeout)
+                    )
+                except asyncio.TimeoutError:
+                    break
+
+            await self._dispatch(batch)
+
+    async def _dispatch(self, batch: List[_PendingRequest]):
+        """Process one batch and resolve its futures
+
+        Args:
+            batch: Requests drained from the queue
+        """
+        # Group by operation, then bin each group by cumulative length so
+        # every combined prompt stays under the client's size cap
+        groups = {}
+        for request in batch:
+            groups.setdefault(request.operation, []).append(request)
+
+        for operation, requests in groups.items():
+            requests.sort(key=lambda r: len(r.text))
+            for bin_requests in self._bins(requests):
+                await self._process_bin(bin_requests, operation)
+
+    def _bins(self, requests: List[_PendingRequest]):
+        """Yield length-bounded bins from length-sorted requests"""
+        limit = self.client._BATCH_CHAR_LIMIT
+        current, size = [], 0
+
+        for request in requests:
+            if current and size + len(request.text) > limit:
+                yield current
+                current, size = [], 0
+            current.append(request)
+            size += len(request.text)
+
+        if current:
+            yield current
+
+    async def _process_bin(self, requests: List[_PendingRequest], operation: str):
+        """Run one bin through the combined-prompt path
+
+        Args:
+            requests: Requests in this bin
+            operation: Operation shared by the bin
+        """
+        texts = [request.text for request in requests]
+
+        try:
+            prompt = self.client._build_batch_prompt(texts, operation)
+            if prompt is not None and len(texts) > 1:
+                semaphore = asyncio.Semaphore(1)
+                response = await self.client._generate_async(prompt, semaphore)
+                results = self.client._parse_batch_response(
+                    response, len(texts), operation
+                )
+            else:
+                results = await self.client.batch_process_async(texts, operation)
+        except Exception as e:
+            self.logger.warning(f"Batch dispatch failed: {e}")
+            results = [None] * len(texts)
+
+        for request, result in zip(requests, results):
+            if not request.future.done():
+                request.future.set_result(result)
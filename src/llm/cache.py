@@ -0,0 +1,70 @@
+"""Response caching for per-question LLM calls"""
+
+import functools
+import hashlib
+import json
+import logging
+import time
+from typing import Callable
+
+from ..core.config import get_config
+
+logger = logging.getLogger(__name__)
+
+# Cached entries older than this are re-fetched
+_DEFAULT_TTL = 24 * 60 * 60
+
+def cached(namespace: str, ttl: int = _DEFAULT_TTL) -> Callable:
+    """Cache a single-text LLM method's result on disk
+
+    Many RD Sharma questions are near-duplicates (same template,
+    different numbers) and whole chapters get reprocessed across runs,
+    so identical LaTeX/type/validation calls recur constantly. Keying on
+    a SHA-256 of the input turns a repeat call's network round-trip into
+    a file read, and the cache survives process restarts — unlike the
+    in-memory prompt cache on the client.
+
+    Args:
+        namespace: Cache subdirectory, one per operation
+        ttl: Entry lifetime in seconds
+
+    Returns:
+        Decorator for methods taking (self, text)
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(self, text: str):
+            config = get_config()
+
+            if not config.cache_enabled:
+                return func(self, text)
+
+            key = hashlib.sha256(text.encode()).hexdigest()
+            path = config.cache_dir / "llm" / namespace / f"{key}.json"
+
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    entry = json.load(f)
+                if time.time() - entry["saved_at"] < ttl:
+                    return entry["result"]
+            except FileNotFoundError:
+                pass
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(f"Ignoring unreadable LLM cache entry: {e}")
+
+            result = func(self, text)
+
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                with open(path, 'w', encoding='utf-8') as f:
+                    json.dump(
+                        {"saved_at": time.time(), "result": result},
+                        f, ensure_ascii=False
+                    )
+            except (OSError, TypeError) as e:
+                logger.warning(f"Failed to write LLM cache entry: {e}")
+
+            return result
+
+        return wrapper
+    return decorator
@@ -1,12 +1,15 @@
 """Google Gemini API client"""
 
+import asyncio
+import hashlib
 import logging
 from typing import Dict, List, Optional
 import google.generativeai as genai
-from tenacity import retry, stop_after_attempt, wait_exponential
+from tenacity import AsyncRetrying, retry, stop_after_attempt, wait_exponential
 
 from ..core.config import get_config
 from ..core.exceptions import LLMError
+from .cache import cached
 from .prompts import PromptTemplates
 from .response_parser import ResponseParser
 
@@ -27,17 +30,22 @@ class GeminiClient:
         # Initialize helpers
         self.prompts = PromptTemplates()
         self.parser = ResponseParser()
-    
+
+        # Responses keyed by prompt digest: repeated prompts (identical
+        # snippets resurface constantly during extraction) skip the
+        # network round-trip entirely
+        self._response_cache: Dict[str, str] = {}
+
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=4, max=10)
     )
-    def generate_response(self, prompt: str) -> str:
-        """Generate response from Gemini
-        
+    def _generate_uncached(self, prompt: str) -> str:
+        """Call the Gemini API (with retries)
+
         Args:
             prompt: Input prompt
-            
+
         Returns:
             Generated response
         """
@@ -47,6 +55,24 @@ class GeminiClient:
         except Exception as e:
             self.logger.error(f"Error generating response: {e}")
             raise LLMError(f"Failed to generate response: {e}")
+
+    def generate_response(self, prompt: str) -> str:
+        """Generate response from Gemini, cached by prompt digest
+
+        Args:
+            prompt: Input prompt
+
+        Returns:
+            Generated response
+        """
+        key = hashlib.blake2b(prompt.encode(), digest_size=16).hexdigest()
+
+        cached = self._response_cache.get(key)
+        if cached is None:
+            cached = self._generate_uncached(prompt)
+            self._response_cache[key] = cached
+
+        return cached
     
     def extract_questions(self, text: str) -> List[Dict]:
         """Extract questions from text
@@ -65,6 +91,7 @@ class GeminiClient:
         
         return questions
     
+    @cached("latex")
     def convert_to_latex(self, text: str) -> str:
         """Convert mathematical text to LaTeX
         
@@ -82,6 +109,7 @@ class GeminiClient:
         
         return latex
     
+    @cached("type")
     def identify_question_type(self, text: str) -> str:
         """Identify type of question
         
@@ -99,6 +127,7 @@ class GeminiClient:
         
         return question_type
     
+    @cached("validation")
     def validate_latex(self, latex: str) -> Dict:
         """Validate LaTeX syntax
         
@@ -134,32 +163,170 @@ class GeminiClient:
         
         return improved_questions
     
-    def batch_process(self, texts: List[str], operation: str) -> List:
-        """Process multiple texts
-        
+    async def _generate_async(self, prompt: str, semaphore: asyncio.Semaphore) -> str:
+        """Generate a response on the event loop, cached by prompt digest
+
+        Args:
+            prompt: Input prompt
+            semaphore: Concurrency limiter shared by the batch
+
+        Returns:
+            Generated response
+        """
+        key = hashlib.blake2b(prompt.encode(), digest_size=16).hexdigest()
+
+        cached = self._response_cache.get(key)
+        if cached is None:
+            async with semaphore:
+                async for attempt in AsyncRetrying(
+                    stop=stop_after_attempt(3),
+                    wait=wait_exponential(multiplier=1, min=4, max=10)
+                ):
+                    with attempt:
+                        response = await self.model.generate_content_async(prompt)
+            cached = response.text
+            self._response_cache[key] = cached
+
+        return cached
+
+    async def batch_process_async(self, texts: List[str], operation: str,
+                                  concurrency: int = 10) -> List:
+        """Process multiple texts concurrently
+
+        Requests overlap on the event loop (the API calls are I/O bound),
+        so total latency approaches that of the slowest call instead of
+        the sum of all calls.
+
         Args:
             texts: List of texts
             operation: Operation to perform
-            
+            concurrency: Maximum number of in-flight API calls
+
         Returns:
             List of results
         """
-        results = []
-        
-        for text in texts:
+        operations = {
+            "extract": (self.prompts.get_question_extraction_prompt,
+                        self.parser.parse_questions),
+            "latex": (self.prompts.get_latex_conversion_prompt,
+                      self.parser.parse_latex),
+            "type": (self.prompts.get_question_type_prompt,
+                     self.parser.parse_question_type),
+        }
+
+        if operation not in operations:
+            return [None] * len(texts)
+
+        build_prompt, parse = operations[operation]
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def process_one(text: str):
             try:
-                if operation == "extract":
-                    result = self.extract_questions(text)
-                elif operation == "latex":
-                    result = self.convert_to_latex(text)
-                elif operation == "type":
-                    result = self.identify_question_type(text)
-                else:
-                    result = None
-                
-                results.append(result)
+                response = await self._generate_async(build_prompt(text), semaphore)
+                return parse(response)
             except Exception as e:
                 self.logger.warning(f"Failed to process text: {e}")
-                results.append(None)
-        
-        return results
\ No newline at end of file
+                return None
+
+        return list(await asyncio.gather(*(process_one(text) for text in texts)))
+
+    # Combined prompts beyond this size fall back to per-text calls so a
+    # large batch never overflows the model context
+    _BATCH_CHAR_LIMIT = 12000
+
+    def _build_batch_prompt(self, texts: List[str], operation: str) -> Optional[str]:
+        """Build a single prompt covering every text in a batch
+
+        One API call for N texts amortizes the fixed instruction overhead
+        and per-request latency across the whole batch.
+
+        Args:
+            texts: List of texts
+            operation: Operation to perform
+
+        Returns:
+            Combined prompt, or None if the operation or size doesn't
+            support batching
+        """
+        instructions = {
+            "latex": "convert each question to proper LaTeX format "
+                     "(use \\frac{}, \\sqrt{}, \\int etc.)",
+            "type": "identify each question's type "
+                    "(illustration/example/exercise/objective/subjective)",
+        }
+
+        if operation not in instructions:
+            return None
+
+        blocks = "\n\n".join(
+            f"### INPUT {i} ###\n{text}" for i, text in enumerate(texts, 1)
+        )
+
+        if len(blocks) > self._BATCH_CHAR_LIMIT:
+            return None
+
+        return f"""Process each of the numbered inputs below independently: {instructions[operation]}.
+
+{blocks}
+
+OUTPUT FORMAT:
+Return a JSON array with one element per input, in order:
+- "index": Input number
+- "result": The result for that input
+
+IMPORTANT: Return ONLY the JSON array, no additional text."""
+
+    def _parse_batch_response(self, response: str, count: int, operation: str) -> List:
+        """Map a combined batch response back onto per-text results
+
+        Args:
+            response: LLM response to a batch prompt
+            count: Number of texts in the batch
+            operation: Operation the batch performed
+
+        Returns:
+            List of results aligned with the input texts (None where the
+            model omitted an input)
+        """
+        entries = self.parser.parse_questions(response)
+
+        results = [None] * count
+        for entry in entries:
+            if not isinstance(entry, dict):
+                continue
+            try:
+                index = int(entry["index"]) - 1
+            except (KeyError, TypeError, ValueError):
+                continue
+            if 0 <= index < count and entry.get("result") is not None:
+                result = str(entry["result"])
+                if operation == "type":
+                    result = self.parser.parse_question_type(result)
+                elif operation == "latex":
+                    result = self.parser.parse_latex(result)
+                results[index] = result
+
+        return results
+
+    def batch_process(self, texts: List[str], operation: str) -> List:
+        """Process multiple texts
+
+        Args:
+            texts: List of texts
+            operation: Operation to perform
+
+        Returns:
+            List of results
+        """
+        # Prefer a single combined call; oversized or unsupported batches
+        # fall back to concurrent per-text calls
+        if len(texts) > 1:
+            batch_prompt = self._build_batch_prompt(texts, operation)
+            if batch_prompt is not None:
+                try:
+                    response = self.generate_response(batch_prompt)
+                    return self._parse_batch_response(response, len(texts), operation)
+                except Exception as e:
+                    self.logger.warning(f"Batch prompt failed, falling back: {e}")
+
+        return asyncio.run(self.batch_process_async(texts, operation))
\ No newline at end of file
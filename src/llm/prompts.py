@@ -2,24 +2,15 @@
 
 from typing import List, Dict
 
-class PromptTemplates:
-    """Templates for various LLM prompts"""
-    
-    def get_question_extraction_prompt(self, text: str) -> str:
-        """Get prompt for question extraction
-        
-        Args:
-            text: Input text
-            
-        Returns:
-            Formatted prompt
-        """
-        return f"""You are an expert at extracting mathematical questions from RD Sharma textbooks.
+# Static instruction blocks hoisted to module constants and placed at
+# the START of every prompt, with the dynamic text appended at the end.
+# Provider-side prompt caching keys on the leading tokens, so keeping
+# the long boilerplate as a byte-stable prefix lets repeated calls hit
+# the cache instead of re-tokenizing the instructions each time.
 
-Given the following text from RD Sharma Class 12, extract ALL questions (including examples, illustrations, and exercises).
+_QUESTION_EXTRACTION_SYS = """You are an expert at extracting mathematical questions from RD Sharma textbooks.
 
-TEXT:
-{text}
+Given the following text from RD Sharma Class 12, extract ALL questions (including examples, illustrations, and exercises).
 
 INSTRUCTIONS:
 1. Extract ONLY questions, not theory or explanations
@@ -36,46 +27,22 @@ Return a JSON array where each element has:
 - "parts": Array of sub-parts if present
 
 IMPORTANT: Return ONLY the JSON array, no additional text."""
-    
-    def get_latex_conversion_prompt(self, text: str) -> str:
-        """Get prompt for LaTeX conversion
-        
-        Args:
-            text: Mathematical text
-            
-        Returns:
-            Formatted prompt
-        """
-        return f"""Convert the following mathematical question to proper LaTeX format.
 
-QUESTION:
-{text}
+_LATEX_CONVERSION_SYS = """Convert the following mathematical question to proper LaTeX format.
 
 INSTRUCTIONS:
 1. Use proper LaTeX commands for all mathematical symbols
-2. Use \\frac{{}} for fractions
+2. Use \\frac{} for fractions
 3. Use ^ for superscripts and _ for subscripts (with braces)
-4. Use \\sqrt{{}} for square roots
+4. Use \\sqrt{} for square roots
 5. Use \\int, \\sum, \\prod for integrals, sums, products
-6. Use \\begin{{equation}} or $ for math mode
+6. Use \\begin{equation} or $ for math mode
 7. Preserve the structure and meaning exactly
 
 OUTPUT:
 Return ONLY the LaTeX formatted question. Do not include any explanation."""
-    
-    def get_question_type_prompt(self, text: str) -> str:
-        """Get prompt for question type identification
-        
-        Args:
-            text: Question text
-            
-        Returns:
-            Formatted prompt
-        """
-        return f"""Identify the type of this mathematical question from RD Sharma.
 
-QUESTION:
-{text}
+_QUESTION_TYPE_SYS = """Identify the type of this mathematical question from RD Sharma.
 
 TYPES:
 - illustration: Worked example with solution
@@ -85,23 +52,11 @@ TYPES:
 - subjective: Descriptive answer question
 
 Return ONLY the type name, nothing else."""
-    
-    def get_latex_validation_prompt(self, latex: str) -> str:
-        """Get prompt for LaTeX validation
-        
-        Args:
-            latex: LaTeX code
-            
-        Returns:
-            Formatted prompt
-        """
-        return f"""Validate the following LaTeX code for mathematical correctness and syntax.
 
-LATEX:
-{latex}
+_LATEX_VALIDATION_SYS = """Validate the following LaTeX code for mathematical correctness and syntax.
 
 Check for:
-1. Balanced braces {{}}
+1. Balanced braces {}
 2. Correct command syntax
 3. Proper math mode delimiters
 4. Valid LaTeX commands
@@ -110,31 +65,87 @@ Return a JSON with:
 - "valid": true/false
 - "errors": list of error descriptions (if any)
 - "corrected": corrected LaTeX (if there are errors)"""
-    
+
+_IMPROVEMENT_SYS = """Review and improve the extraction of questions from this RD Sharma text.
+
+Please:
+1. Check if any questions were missed
+2. Verify question completeness
+3. Ensure mathematical notation is preserved
+4. Check question numbering
+
+Return an improved JSON array of questions with the same format as before."""
+
+# Full prefixes (instructions plus the section label) precomputed once:
+# each get_*_prompt is then a single string concatenation with a stable
+# prefix object, rather than f-string assembly of ~1KB of boilerplate
+# per call
+_QUESTION_EXTRACTION_PREFIX = _QUESTION_EXTRACTION_SYS + "\n\nTEXT:\n"
+_LATEX_CONVERSION_PREFIX = _LATEX_CONVERSION_SYS + "\n\nQUESTION:\n"
+_QUESTION_TYPE_PREFIX = _QUESTION_TYPE_SYS + "\n\nQUESTION:\n"
+_LATEX_VALIDATION_PREFIX = _LATEX_VALIDATION_SYS + "\n\nLATEX:\n"
+
+class PromptTemplates:
+    """Templates for various LLM prompts"""
+
+    def get_question_extraction_prompt(self, text: str) -> str:
+        """Get prompt for question extraction
+
+        Args:
+            text: Input text
+
+        Returns:
+            Formatted prompt
+        """
+        return _QUESTION_EXTRACTION_PREFIX + text
+
+    def get_latex_conversion_prompt(self, text: str) -> str:
+        """Get prompt for LaTeX conversion
+
+        Args:
+            text: Mathematical text
+
+        Returns:
+            Formatted prompt
+        """
+        return _LATEX_CONVERSION_PREFIX + text
+
+    def get_question_type_prompt(self, text: str) -> str:
+        """Get prompt for question type identification
+
+        Args:
+            text: Question text
+
+        Returns:
+            Formatted prompt
+        """
+        return _QUESTION_TYPE_PREFIX + text
+
+    def get_latex_validation_prompt(self, latex: str) -> str:
+        """Get prompt for LaTeX validation
+
+        Args:
+            latex: LaTeX code
+
+        Returns:
+            Formatted prompt
+        """
+        return _LATEX_VALIDATION_PREFIX + latex
+
     def get_improvement_prompt(self, text: str, initial_questions: List[str]) -> str:
         """Get prompt for improving extraction
-        
+
         Args:
             text: Original text
             initial_questions: Initially extracted questions
-            
+
         Returns:
             Formatted prompt
         """
         questions_str = "\n".join([f"{i+1}. {q}" for i, q in enumerate(initial_questions)])
-        
-        return f"""Review and improve the extraction of questions from this RD Sharma text.
-
-ORIGINAL TEXT:
-{text}
-
-INITIALLY EXTRACTED QUESTIONS:
-{questions_str}
-
-Please:
-1. Check if any questions were missed
-2. Verify question completeness
-3. Ensure mathematical notation is preserved
-4. Check question numbering
 
-Return an improved JSON array of questions with the same format as before."""
\ No newline at end of file
+        return (
+            f"{_IMPROVEMENT_SYS}\n\n"
+            f"ORIGINAL TEXT:\n{text}\n\n"
+            f"INITIALLY EXTRACTED QUESTIONS:\n{questions_str}"
+        )
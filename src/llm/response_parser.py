@@ -5,6 +5,57 @@ import re
 import logging
 from typing import Dict, List, Optional, Any
 
+# Compiled once: markdown code fences to strip and phrases that mark a
+# line as LLM explanation rather than LaTeX
+_MD_FENCE_RE = re.compile(r'```(?:latex)?\n?')
+_EXPLAIN_RE = re.compile(r'here is|this is|the latex|converted', re.IGNORECASE)
+
+def _extract_json_span(text: str, open_char: str, close_char: str) -> Optional[str]:
+    """Extract the first balanced JSON array/object from surrounding text
+
+    A single left-to-right walk tracking bracket depth (and skipping
+    over string literals, including escaped quotes). The old
+    re.search(r'\\[.*\\]', ..., DOTALL) approach could backtrack
+    quadratically on long malformed responses and greedily spanned to
+    the last bracket in the text.
+
+    Args:
+        text: Response text possibly containing JSON
+        open_char: Opening bracket ('[' or '{')
+        close_char: Matching closing bracket
+
+    Returns:
+        The balanced JSON substring, or None if not found
+    """
+    start = text.find(open_char)
+    if start == -1:
+        return None
+
+    depth = 0
+    in_string = False
+    escaped = False
+
+    for i in range(start, len(text)):
+        char = text[i]
+
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == '\\':
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == open_char:
+            depth += 1
+        elif char == close_char:
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+
+    return None
+
 class ResponseParser:
     """Parse responses from LLM"""
     
@@ -32,15 +83,15 @@ class ResponseParser:
                 return []
         except json.JSONDecodeError:
             # Try to extract JSON from response
-            json_match = re.search(r'\[.*\]', response, re.DOTALL)
-            
-            if json_match:
+            json_span = _extract_json_span(response, '[', ']')
+
+            if json_span:
                 try:
-                    questions = json.loads(json_match.group())
+                    questions = json.loads(json_span)
                     return questions
                 except json.JSONDecodeError:
                     pass
-            
+
             # Fallback: Parse as text
             return self._parse_questions_from_text(response)
     
@@ -87,20 +138,16 @@ class ResponseParser:
         Returns:
             LaTeX string
         """
-        # Remove any markdown code blocks
-        response = re.sub(r'```latex\n?', '', response)
-        response = re.sub(r'```\n?', '', response)
-        
-        # Remove any explanatory text before/after
-        lines = response.split('\n')
-        latex_lines = []
-        
-        for line in lines:
-            # Skip lines that look like explanations
-            if not any(phrase in line.lower() for phrase in 
-                      ['here is', 'this is', 'the latex', 'converted']):
-                latex_lines.append(line)
-        
+        # Remove any markdown code blocks (one pass for both fence forms)
+        response = _MD_FENCE_RE.sub('', response)
+
+        # Drop explanatory lines: one case-insensitive regex scan per
+        # line instead of four substring searches over a lowered copy
+        latex_lines = [
+            line for line in response.split('\n')
+            if not _EXPLAIN_RE.search(line)
+        ]
+
         return '\n'.join(latex_lines).strip()
     
     def parse_question_type(self, response: str) -> str:
@@ -136,11 +183,11 @@ class ResponseParser:
             return result
         except json.JSONDecodeError:
             # Try to extract JSON
-            json_match = re.search(r'\{.*\}', response, re.DOTALL)
-            
-            if json_match:
+            json_span = _extract_json_span(response, '{', '}')
+
+            if json_span:
                 try:
-                    result = json.loads(json_match.group())
+                    result = json.loads(json_span)
                     return result
                 except json.JSONDecodeError:
                     pass
@@ -1,5 +1,7 @@
 """Export functionality for different formats"""
 
+import asyncio
+import hashlib
 import json
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -19,7 +21,7 @@ class Exporter:
         self.file_handler = FileHandler()
         self.config = get_config()
     
-    def export_latex(self, questions: List[Dict], filepath: Optional[Path] = None) -> str:
+    def export_latex(self, questions: List[Dict], filepath: Optional[Path] = None) -> Optional[str]:
         """Export questions as LaTeX
         
         Args:
@@ -27,16 +29,19 @@ class Exporter:
             filepath: Optional output filepath
             
         Returns:
-            LaTeX content
+            LaTeX content, or None when streamed to filepath
         """
-        latex_content = self.formatter.format_latex(questions)
-        
         if filepath:
-            self.file_handler.save_latex(latex_content, filepath)
-        
-        return latex_content
+            # Stream straight to disk: the full document string is
+            # never materialized in memory
+            self.file_handler.save_lines(
+                self.formatter.iter_latex(questions), filepath
+            )
+            return None
+
+        return self.formatter.format_latex(questions)
     
-    def export_markdown(self, questions: List[Dict], filepath: Optional[Path] = None) -> str:
+    def export_markdown(self, questions: List[Dict], filepath: Optional[Path] = None) -> Optional[str]:
         """Export questions as Markdown
         
         Args:
@@ -44,14 +49,15 @@ class Exporter:
             filepath: Optional output filepath
             
         Returns:
-            Markdown content
+            Markdown content, or None when streamed to filepath
         """
-        md_content = self.formatter.format_markdown(questions)
-        
         if filepath:
-            self.file_handler.save_markdown(md_content, filepath)
-        
-        return md_content
+            self.file_handler.save_lines(
+                self.formatter.iter_markdown(questions), filepath
+            )
+            return None
+
+        return self.formatter.format_markdown(questions)
     
     def export_json(self, questions: List[Dict], filepath: Optional[Path] = None) -> str:
         """Export questions as JSON
@@ -65,10 +71,12 @@ class Exporter:
         """
         json_data = self.formatter.format_json(questions)
         json_content = json.dumps(json_data, indent=2, ensure_ascii=False)
-        
+
         if filepath:
-            self.file_handler.save_json(json_data, filepath)
-        
+            # Reuse the string serialized above instead of dumping the
+            # structure a second time inside save_json
+            self.file_handler.save_json_string(json_content, filepath)
+
         return json_content
     
     def export_pdf(self, questions: List[Dict], filepath: Optional[Path] = None) -> Optional[bytes]:
@@ -78,77 +86,175 @@ class Exporter:
             questions: List of questions
             filepath: Optional output filepath
             
+        Returns:
+            PDF bytes or None if failed
+        """
+        latex_content = self.formatter.format_latex(questions)
+        return self._export_pdf_from_latex(latex_content, filepath)
+
+    def _export_pdf_from_latex(self, latex_content: str,
+                               filepath: Optional[Path] = None) -> Optional[bytes]:
+        """Compile already-formatted LaTeX content to PDF
+
+        Split out so callers that have formatted the questions once
+        (export_all_formats) don't pay a second O(N) format pass.
+
+        Args:
+            latex_content: Complete LaTeX document source
+            filepath: Optional output filepath
+
         Returns:
             PDF bytes or None if failed
         """
         try:
-            # Create LaTeX content
-            latex_content = self.formatter.format_latex(questions)
-            
-            # Create temporary directory
-            with tempfile.TemporaryDirectory() as tmpdir:
-                # Save LaTeX file
-                tex_file = Path(tmpdir) / "questions.tex"
-                tex_file.write_text(latex_content)
-                
-                # Compile LaTeX to PDF
-                result = subprocess.run(
-                    ["pdflatex", "-interaction=nonstopmode", str(tex_file)],
-                    cwd=tmpdir,
-                    capture_output=True,
-                    text=True
-                )
-                
-                if result.returncode == 0:
-                    # Read PDF
-                    pdf_file = Path(tmpdir) / "questions.pdf"
-                    if pdf_file.exists():
-                        pdf_bytes = pdf_file.read_bytes()
-                        
-                        if filepath:
-                            filepath.write_bytes(pdf_bytes)
-                        
-                        return pdf_bytes
-                else:
-                    print(f"LaTeX compilation failed: {result.stderr}")
-                    return None
+            # Build in a persistent directory keyed by content hash:
+            # re-exporting unchanged questions returns the cached PDF
+            # without spawning LaTeX at all, and latexmk skips redundant
+            # aux/bibliography passes when only part of the tree changed
+            digest = hashlib.sha256(latex_content.encode()).hexdigest()[:16]
+            build_dir = Path(tempfile.gettempdir()) / "rdsharma_pdf" / digest
+            pdf_file = build_dir / "questions.pdf"
+
+            if pdf_file.exists():
+                pdf_bytes = pdf_file.read_bytes()
+                if filepath:
+                    filepath.write_bytes(pdf_bytes)
+                return pdf_bytes
+
+            build_dir.mkdir(parents=True, exist_ok=True)
+            tex_file = build_dir / "questions.tex"
+            tex_file.write_text(latex_content)
+
+            result = self._run_latex(build_dir, tex_file)
+
+            if result.returncode == 0 and pdf_file.exists():
+                pdf_bytes = pdf_file.read_bytes()
+
+                if filepath:
+                    filepath.write_bytes(pdf_bytes)
+
+                return pdf_bytes
+
+            print(f"LaTeX compilation failed: {self._tail_log(build_dir)}")
+            return None
         except FileNotFoundError:
-            print("pdflatex not found. Please install LaTeX.")
+            print("latexmk/pdflatex not found. Please install LaTeX.")
             return None
         except Exception as e:
             print(f"Error generating PDF: {e}")
             return None
+
+    @staticmethod
+    def _run_latex(build_dir: Path, tex_file: Path) -> subprocess.CompletedProcess:
+        """Compile a .tex file to PDF in the given build directory
+
+        Prefers latexmk (incremental, reruns passes only when needed),
+        falling back to a single pdflatex pass where it isn't installed.
+        Compiler output goes entirely to /dev/null — pdflatex can emit
+        megabytes of log chatter that would otherwise be buffered and
+        decoded per compile; failures are diagnosed from the .log file
+        on disk instead.
+
+        Args:
+            build_dir: Directory to compile in
+            tex_file: LaTeX source file
+
+        Returns:
+            Completed process of the compiler run
+        """
+        try:
+            return subprocess.run(
+                ["latexmk", "-pdf", "-interaction=nonstopmode", "-halt-on-error",
+                 f"-outdir={build_dir}", str(tex_file)],
+                cwd=build_dir,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                check=False
+            )
+        except FileNotFoundError:
+            return subprocess.run(
+                ["pdflatex", "-interaction=nonstopmode", "-halt-on-error",
+                 str(tex_file)],
+                cwd=build_dir,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                check=False
+            )
+
+    @staticmethod
+    def _tail_log(build_dir: Path, lines: int = 50) -> str:
+        """Read the tail of the LaTeX log for error reporting
+
+        Only touched on the failure path, so the success path never
+        pays for reading or decoding the log.
+
+        Args:
+            build_dir: Directory the compile ran in
+            lines: Number of trailing lines to keep
+
+        Returns:
+            Last lines of the log, or a placeholder if unreadable
+        """
+        log_file = build_dir / "questions.log"
+
+        try:
+            log_lines = log_file.read_text(errors='replace').splitlines()
+        except OSError:
+            return "(no log file)"
+
+        return '\n'.join(log_lines[-lines:])
     
-    def export_all_formats(self, questions: List[Dict], base_filename: str) -> Dict[str, Path]:
-        """Export questions in all formats
-        
+    async def export_all_formats_async(self, questions: List[Dict],
+                                       base_filename: str) -> Dict[str, Path]:
+        """Export questions in all formats concurrently
+
+        The text exports are quick but the PDF blocks on the LaTeX
+        compiler for seconds; running all four under threads overlaps
+        them, so wall time tracks the slowest export instead of the sum.
+
         Args:
             questions: List of questions
             base_filename: Base filename without extension
-            
+
         Returns:
             Dictionary of format to filepath
         """
-        output_files = {}
-        
-        # LaTeX
         latex_file = self.config.get_output_path(f"{base_filename}.tex", "latex")
-        self.export_latex(questions, latex_file)
-        output_files['latex'] = latex_file
-        
-        # Markdown
         md_file = self.config.get_output_path(f"{base_filename}.md", "markdown")
-        self.export_markdown(questions, md_file)
-        output_files['markdown'] = md_file
-        
-        # JSON
         json_file = self.config.get_output_path(f"{base_filename}.json", "json")
-        self.export_json(questions, json_file)
-        output_files['json'] = json_file
-        
-        # PDF (if LaTeX is available)
         pdf_file = self.config.get_output_path(f"{base_filename}.pdf", "pdf")
-        if self.export_pdf(questions, pdf_file):
+
+        # Format the LaTeX once and share it between the .tex file and
+        # the PDF compiler instead of building the document twice
+        latex_content = self.formatter.format_latex(questions)
+
+        results = await asyncio.gather(
+            asyncio.to_thread(self.file_handler.save_latex, latex_content, latex_file),
+            asyncio.to_thread(self.export_markdown, questions, md_file),
+            asyncio.to_thread(self.export_json, questions, json_file),
+            asyncio.to_thread(self._export_pdf_from_latex, latex_content, pdf_file),
+        )
+
+        output_files = {
+            'latex': latex_file,
+            'markdown': md_file,
+            'json': json_file,
+        }
+
+        # PDF only counts if LaTeX is available and compilation worked
+        if results[3]:
             output_files['pdf'] = pdf_file
-        
-        return output_files
\ No newline at end of file
+
+        return output_files
+
+    def export_all_formats(self, questions: List[Dict], base_filename: str) -> Dict[str, Path]:
+        """Export questions in all formats
+
+        Args:
+            questions: List of questions
+            base_filename: Base filename without extension
+
+        Returns:
+            Dictionary of format to filepath
+        """
+        return asyncio.run(self.export_all_formats_async(questions, base_filename))
\ No newline at end of file
@@ -1,11 +1,59 @@
 """Format extracted questions for output"""
 
-from typing import Dict, List
+from typing import Dict, Iterator, List
 from ..core.constants import ExportFormat
+from ..core.models import Question
+
+# Per-question templates filled with format_map: one formatting call and
+# one append per question instead of a handful of small f-string
+# appends and branches each
+_LATEX_QUESTION_TEMPLATE = "\\section*{{Question {i}}}\n{body}\n"
+
+_MD_QUESTION_TEMPLATE = (
+    "## Question {i}\n"
+    "{number_line}"
+    "\n**LaTeX:**\n"
+    "```latex\n{body}\n```\n"
+    "{page_line}"
+    "\n---\n"
+)
+
+_LATEX_HEADER = (
+    "\\documentclass[12pt]{article}",
+    "\\usepackage{amsmath}",
+    "\\usepackage{amssymb}",
+    "\\usepackage{enumitem}",
+    "\\usepackage{geometry}",
+    "\\geometry{a4paper, margin=1in}",
+    "",
+    "\\title{RD Sharma Class 12 - Extracted Questions}",
+    "\\date{\\today}",
+    "",
+    "\\begin{document}",
+    "\\maketitle",
+    ""
+)
+
+_LATEX_FOOTER = ("\\end{document}",)
 
 class Formatter:
     """Format questions for various outputs"""
-    
+
+    @staticmethod
+    def _normalize(questions: List) -> List[Question]:
+        """Resolve each question's output fields once up front
+
+        Args:
+            questions: Question dictionaries or Question objects
+
+        Returns:
+            List of normalized Question objects
+        """
+        return [
+            q if isinstance(q, Question) else Question.from_dict(q)
+            for q in questions
+        ]
+
     def format_latex(self, questions: List[Dict]) -> str:
         """Format questions as LaTeX document
         
@@ -15,30 +63,28 @@ class Formatter:
         Returns:
             LaTeX formatted string
         """
-        latex_parts = [
-            "\\documentclass[12pt]{article}",
-            "\\usepackage{amsmath}",
-            "\\usepackage{amssymb}",
-            "\\usepackage{enumitem}",
-            "\\usepackage{geometry}",
-            "\\geometry{a4paper, margin=1in}",
-            "",
-            "\\title{RD Sharma Class 12 - Extracted Questions}",
-            "\\date{\\today}",
-            "",
-            "\\begin{document}",
-            "\\maketitle",
-            ""
-        ]
-        
-        for i, question in enumerate(questions, 1):
-            latex_parts.append(f"\\section*{{Question {i}}}")
-            latex_parts.append(question.get('latex', question.get('text', '')))
-            latex_parts.append("")
-        
-        latex_parts.append("\\end{document}")
-        
-        return '\n'.join(latex_parts)
+        # One join over the line generator: no per-question list appends
+        # and no intermediate list proportional to the question count
+        return '\n'.join(self.iter_latex(questions))
+
+    def iter_latex(self, questions: List[Dict]) -> Iterator[str]:
+        """Yield the LaTeX document piece by piece
+
+        Lets callers stream thousands of questions straight to disk
+        without ever materializing the whole document string.
+
+        Args:
+            questions: List of questions
+
+        Yields:
+            Document fragments (one logical line each)
+        """
+        yield from _LATEX_HEADER
+
+        for i, question in enumerate(self._normalize(questions), 1):
+            yield _LATEX_QUESTION_TEMPLATE.format(i=i, body=question.latex)
+
+        yield from _LATEX_FOOTER
     
     def format_markdown(self, questions: List[Dict]) -> str:
         """Format questions as Markdown
@@ -49,33 +95,33 @@ class Formatter:
         Returns:
             Markdown formatted string
         """
-        md_parts = [
-            "# RD Sharma Class 12 - Extracted Questions",
-            "",
-            f"**Total Questions:** {len(questions)}",
-            "",
-            "---",
-            ""
-        ]
-        
-        for i, question in enumerate(questions, 1):
-            md_parts.append(f"## Question {i}")
-            
-            if question.get('number'):
-                md_parts.append(f"**Original Number:** {question['number']}")
-            
-            md_parts.append("")
-            md_parts.append("**LaTeX:**")
-            md_parts.append(f"```latex\n{question.get('latex', question.get('text', ''))}\n```")
-            
-            if question.get('page_number'):
-                md_parts.append(f"*Page: {question['page_number']}*")
-            
-            md_parts.append("")
-            md_parts.append("---")
-            md_parts.append("")
-        
-        return '\n'.join(md_parts)
+        return '\n'.join(self.iter_markdown(questions))
+
+    def iter_markdown(self, questions: List[Dict]) -> Iterator[str]:
+        """Yield the Markdown document piece by piece
+
+        Args:
+            questions: List of questions
+
+        Yields:
+            Document fragments (one logical line each)
+        """
+        yield "# RD Sharma Class 12 - Extracted Questions"
+        yield ""
+        yield f"**Total Questions:** {len(questions)}"
+        yield ""
+        yield "---"
+        yield ""
+
+        for i, question in enumerate(self._normalize(questions), 1):
+            yield _MD_QUESTION_TEMPLATE.format(
+                i=i,
+                number_line=(f"**Original Number:** {question.number}\n"
+                             if question.number else ""),
+                body=question.latex,
+                page_line=(f"*Page: {question.page_number}*\n"
+                           if question.page_number else "")
+            )
     
     def format_json(self, questions: List[Dict]) -> Dict:
         """Format questions as JSON
@@ -2,9 +2,138 @@
 
 import re
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from typing import Dict, List, Optional, Tuple
 
-from ..core.constants import LATEX_DELIMITERS, MATH_SYMBOLS
+from ..core.constants import LATEX_DELIMITERS, replace_math_symbols
+
+# RE2 guarantees linear-time matching (no backtracking blowup on
+# adversarial OCR/LLM text) and its DFA walk is faster on the big fused
+# alternation. None of the rules on that path use backreferences, so
+# the pattern compiles unchanged; stdlib re remains the fallback where
+# pyre2 isn't installed
+try:
+    import re2 as _fused_engine
+except ImportError:
+    _fused_engine = re
+
+# Every conversion rule compiled once at import, grouped by stage. The
+# converter runs all of them against every question, so inline re.sub
+# calls would pay a pattern-cache lookup (and Python dispatch) per rule
+# per question on the hot path
+_FRACTION_RULES = (
+    # Simple fractions like 1/2
+    (re.compile(r'(\d+)\s*/\s*(\d+)'), r'\\frac{\1}{\2}'),
+    # Complex fractions with parentheses
+    (re.compile(r'\(([^)]+)\)\s*/\s*\(([^)]+)\)'), r'\\frac{\1}{\2}'),
+    # Fractions with variables
+    (re.compile(r'([a-zA-Z]+)\s*/\s*([a-zA-Z]+)'), r'\\frac{\1}{\2}'),
+)
+
+_EXPONENT_SUBSCRIPT_RULES = (
+    # Exponents
+    (re.compile(r'([a-zA-Z0-9])\^([a-zA-Z0-9]+)'), r'\1^{\2}'),
+    (re.compile(r'([a-zA-Z0-9])\^([+-]?\d+)'), r'\1^{\2}'),
+    # Subscripts
+    (re.compile(r'([a-zA-Z])_([a-zA-Z0-9]+)'), r'\1_{\2}'),
+    (re.compile(r'([a-zA-Z])_(\d+)'), r'\1_{\2}'),
+    # Special cases like x^2, x^3
+    (re.compile(r'\b([xyz])\s*\^\s*2\b'), r'\1^2'),
+    (re.compile(r'\b([xyz])\s*\^\s*3\b'), r'\1^3'),
+)
+
+_ROOT_RULES = (
+    # Square roots
+    (re.compile(r'√\s*([a-zA-Z0-9]+)'), r'\\sqrt{\1}'),
+    (re.compile(r'sqrt\s*\(([^)]+)\)'), r'\\sqrt{\1}'),
+    # Nth roots
+    (re.compile(r'(\d+)th\s+root\s+of\s+([a-zA-Z0-9]+)'), r'\\sqrt[\1]{\2}'),
+)
+
+_INTEGRAL_SUM_RULES = (
+    # Integrals
+    (re.compile(r'∫'), r'\\int'),
+    (re.compile(r'integral\s+from\s+([a-zA-Z0-9]+)\s+to\s+([a-zA-Z0-9]+)'),
+     r'\\int_{\1}^{\2}'),
+    # Summations
+    (re.compile(r'Σ'), r'\\sum'),
+    (re.compile(r'sum\s+from\s+([a-zA-Z0-9]+)\s*=\s*([a-zA-Z0-9]+)\s+to\s+([a-zA-Z0-9]+)'),
+     r'\\sum_{\1=\2}^{\3}'),
+    # Products
+    (re.compile(r'∏'), r'\\prod'),
+)
+
+_PROBABILITY_RULES = (
+    # P(A), P(A|B), etc.
+    (re.compile(r'P\s*\(([^)]+)\)'), r'P(\1)'),
+    (re.compile(r'P\s*\(([^|]+)\s*\|\s*([^)]+)\)'), r'P(\1 \\mid \2)'),
+    # Expectation
+    (re.compile(r'E\s*\[([^\]]+)\]'), r'\\mathbb{E}[\1]'),
+    # Variance
+    (re.compile(r'Var\s*\(([^)]+)\)'), r'\\text{Var}(\1)'),
+    # Combinations and permutations
+    (re.compile(r'C\s*\(\s*([a-zA-Z0-9]+)\s*,\s*([a-zA-Z0-9]+)\s*\)'),
+     r'\\binom{\1}{\2}'),
+    (re.compile(r'nCr'), r'\\binom{n}{r}'),
+    (re.compile(r'nPr'), r'P_n^r'),
+)
+
+# Simple matrix detection (replacer is a callable, pattern still
+# precompiled)
+_MATRIX_RE = re.compile(r'\[\s*([^\]]+)\s*\]')
+
+# All stages fused into one alternation with a named group per stage,
+# so the text is walked exactly once instead of ~15 times. Inner
+# capture groups are neutralized for the alternation (lastgroup must be
+# the stage name); the dispatcher reapplies the stage's own rules to
+# the short matched token, preserving each stage's sequential
+# semantics on that token
+_NONCAPTURE_RE = re.compile(r'(?<!\\)\((?!\?)')
+
+_FUSED_STAGES = (
+    ('frac', _FRACTION_RULES),
+    ('expsub', _EXPONENT_SUBSCRIPT_RULES),
+    ('root', _ROOT_RULES),
+    ('intsum', _INTEGRAL_SUM_RULES),
+    ('prob', _PROBABILITY_RULES),
+)
+
+_FUSED_RE = _fused_engine.compile('|'.join(
+    '(?P<{}>{})'.format(
+        name,
+        '|'.join(
+            _NONCAPTURE_RE.sub('(?:', pattern.pattern)
+            for pattern, _ in rules
+        )
+    )
+    for name, rules in _FUSED_STAGES
+))
+
+_STAGE_RULES = dict(_FUSED_STAGES)
+
+def _fused_dispatch(match: "re.Match") -> str:
+    """Convert one matched token with its stage's rules"""
+    token = match.group(0)
+    for pattern, repl in _STAGE_RULES[match.lastgroup]:
+        token = pattern.sub(repl, token)
+    return token
+
+# Existing LaTeX commands to protect from conversion, and the
+# placeholders they are swapped out for
+_LATEX_CMD_RE = re.compile(r'\\[a-zA-Z]+(?:\{[^}]*\})*')
+_PLACEHOLDER_RE = re.compile(r'__LATEX_CMD_(\d+)__')
+
+# LaTeX special characters that need escaping (built once, not per call)
+_SPECIAL_CHARS = {
+    '%': r'\%',
+    '&': r'\&',
+    '#': r'\#',
+    '_': r'\_',  # except in math mode
+    '{': r'\{',
+    '}': r'\}',
+}
 
 class LaTeXConverter:
     """Convert text and math expressions to LaTeX"""
@@ -23,43 +152,46 @@ class LaTeXConverter:
         Returns:
             LaTeX formatted text
         """
-        # First, identify and protect existing LaTeX
-        text = self._protect_existing_latex(text)
-        
+        # First, identify and protect existing LaTeX. The protected
+        # commands stay in locals rather than on the instance, so one
+        # converter can serve concurrent threads
+        text, protected = self._protect_existing_latex(text)
+
         # Convert mathematical expressions
         text = self._convert_math_expressions(text)
-        
+
         # Convert special characters
         text = self._convert_special_characters(text)
-        
+
         # Apply math mode delimiters
         text = self._apply_math_mode(text, math_mode)
-        
+
         # Format for LaTeX document
-        text = self._format_for_document(text)
-        
+        text = self._format_for_document(text, protected)
+
         return text
     
-    def _protect_existing_latex(self, text: str) -> str:
+    def _protect_existing_latex(self, text: str) -> Tuple[str, List[str]]:
         """Protect existing LaTeX commands from conversion
-        
+
         Args:
             text: Text with potential LaTeX
-            
+
         Returns:
-            Text with protected LaTeX
+            Text with protected LaTeX, and the commands to restore later
         """
-        # Mark existing LaTeX commands
-        latex_commands = re.findall(r'\\[a-zA-Z]+(?:\{[^}]*\})*', text)
-        
-        for i, cmd in enumerate(latex_commands):
-            placeholder = f"__LATEX_CMD_{i}__"
-            text = text.replace(cmd, placeholder)
-        
-        # Store for later restoration
-        self._protected_commands = latex_commands
-        
-        return text
+        # Swap each command for an indexed placeholder in one sub pass
+        # (the old per-command str.replace rescanned the whole text N
+        # times, and could clobber commands sharing a prefix)
+        protected = []
+
+        def _grab(match):
+            protected.append(match.group(0))
+            return f"__LATEX_CMD_{len(protected) - 1}__"
+
+        text = _LATEX_CMD_RE.sub(_grab, text)
+
+        return text, protected
     
     def _convert_math_expressions(self, text: str) -> str:
         """Convert mathematical expressions to LaTeX
@@ -70,111 +202,16 @@ class LaTeXConverter:
         Returns:
             Text with LaTeX math
         """
-        # Convert fractions
-        text = self._convert_fractions(text)
-        
-        # Convert exponents and subscripts
-        text = self._convert_exponents_subscripts(text)
-        
-        # Convert roots
-        text = self._convert_roots(text)
-        
-        # Convert integrals and sums
-        text = self._convert_integrals_sums(text)
-        
-        # Convert matrices
+        # Fractions, exponents/subscripts, roots, integrals/sums and
+        # probability notation in one fused scan of the text
+        text = _FUSED_RE.sub(_fused_dispatch, text)
+
+        # Convert matrices (rows need surrounding context, so this
+        # stays its own pass)
         text = self._convert_matrices(text)
-        
-        # Convert probability notation
-        text = self._convert_probability(text)
-        
-        return text
-    
-    def _convert_fractions(self, text: str) -> str:
-        """Convert fractions to LaTeX format
-        
-        Args:
-            text: Text with fractions
-            
-        Returns:
-            Text with LaTeX fractions
-        """
-        # Simple fractions like 1/2
-        text = re.sub(r'(\d+)\s*/\s*(\d+)', r'\\frac{\1}{\2}', text)
-        
-        # Complex fractions with parentheses
-        text = re.sub(r'\(([^)]+)\)\s*/\s*\(([^)]+)\)', r'\\frac{\1}{\2}', text)
-        
-        # Fractions with variables
-        text = re.sub(r'([a-zA-Z]+)\s*/\s*([a-zA-Z]+)', r'\\frac{\1}{\2}', text)
-        
-        return text
-    
-    def _convert_exponents_subscripts(self, text: str) -> str:
-        """Convert exponents and subscripts
-        
-        Args:
-            text: Text with exponents/subscripts
-            
-        Returns:
-            Converted text
-        """
-        # Exponents
-        text = re.sub(r'([a-zA-Z0-9])\^([a-zA-Z0-9]+)', r'\1^{\2}', text)
-        text = re.sub(r'([a-zA-Z0-9])\^([+-]?\d+)', r'\1^{\2}', text)
-        
-        # Subscripts
-        text = re.sub(r'([a-zA-Z])_([a-zA-Z0-9]+)', r'\1_{\2}', text)
-        text = re.sub(r'([a-zA-Z])_(\d+)', r'\1_{\2}', text)
-        
-        # Special cases like x^2, x^3
-        text = re.sub(r'\b([xyz])\s*\^\s*2\b', r'\1^2', text)
-        text = re.sub(r'\b([xyz])\s*\^\s*3\b', r'\1^3', text)
-        
-        return text
-    
-    def _convert_roots(self, text: str) -> str:
-        """Convert root expressions
-        
-        Args:
-            text: Text with roots
-            
-        Returns:
-            Converted text
-        """
-        # Square roots
-        text = re.sub(r'√\s*([a-zA-Z0-9]+)', r'\\sqrt{\1}', text)
-        text = re.sub(r'sqrt\s*\(([^)]+)\)', r'\\sqrt{\1}', text)
-        
-        # Nth roots
-        text = re.sub(r'(\d+)th\s+root\s+of\s+([a-zA-Z0-9]+)', r'\\sqrt[\1]{\2}', text)
-        
-        return text
-    
-    def _convert_integrals_sums(self, text: str) -> str:
-        """Convert integrals and summations
-        
-        Args:
-            text: Text with integrals/sums
-            
-        Returns:
-            Converted text
-        """
-        # Integrals
-        text = re.sub(r'∫', r'\\int', text)
-        text = re.sub(r'integral\s+from\s+([a-zA-Z0-9]+)\s+to\s+([a-zA-Z0-9]+)',
-                     r'\\int_{\1}^{\2}', text)
-        
-        # Summations
-        text = re.sub(r'Σ', r'\\sum', text)
-        text = re.sub(r'sum\s+from\s+([a-zA-Z0-9]+)\s*=\s*([a-zA-Z0-9]+)\s+to\s+([a-zA-Z0-9]+)',
-                     r'\\sum_{\1=\2}^{\3}', text)
-        
-        # Products
-        text = re.sub(r'∏', r'\\prod', text)
-        
+
         return text
-    
+
     def _convert_matrices(self, text: str) -> str:
         """Convert matrix notation
         
@@ -184,9 +221,6 @@ class LaTeXConverter:
         Returns:
             Converted text
         """
-        # Simple matrix detection
-        matrix_pattern = r'\[\s*([^\]]+)\s*\]'
-        
         def matrix_replacer(match):
             content = match.group(1)
             # Check if it looks like a matrix
@@ -196,37 +230,10 @@ class LaTeXConverter:
                 return f'\\begin{{bmatrix}} {matrix_content} \\end{{bmatrix}}'
             return match.group(0)
         
-        text = re.sub(matrix_pattern, matrix_replacer, text)
-        
-        return text
-    
-    def _convert_probability(self, text: str) -> str:
-        """Convert probability notation
-        
-        Args:
-            text: Text with probability notation
-            
-        Returns:
-            Converted text
-        """
-        # P(A), P(A|B), etc.
-        text = re.sub(r'P\s*\(([^)]+)\)', r'P(\1)', text)
-        text = re.sub(r'P\s*\(([^|]+)\s*\|\s*([^)]+)\)', r'P(\1 \\mid \2)', text)
-        
-        # Expectation
-        text = re.sub(r'E\s*\[([^\]]+)\]', r'\\mathbb{E}[\1]', text)
-        
-        # Variance
-        text = re.sub(r'Var\s*\(([^)]+)\)', r'\\text{Var}(\1)', text)
-        
-        # Combinations and permutations
-        text = re.sub(r'C\s*\(\s*([a-zA-Z0-9]+)\s*,\s*([a-zA-Z0-9]+)\s*\)',
-                     r'\\binom{\1}{\2}', text)
-        text = re.sub(r'nCr', r'\\binom{n}{r}', text)
-        text = re.sub(r'nPr', r'P_n^r', text)
-        
+        text = _MATRIX_RE.sub(matrix_replacer, text)
+
         return text
-    
+
     def _convert_special_characters(self, text: str) -> str:
         """Convert special characters to LaTeX
         
@@ -236,23 +243,13 @@ class LaTeXConverter:
         Returns:
             Converted text
         """
-        # Greek letters and symbols
-        for symbol, latex in MATH_SYMBOLS.items():
-            text = text.replace(symbol, latex)
-        
-        # LaTeX special characters that need escaping
-        special_chars = {
-            '%': r'\%',
-            '&': r'\&',
-            '#': r'\#',
-            '_': r'\_',  # except in math mode
-            '{': r'\{',
-            '}': r'\}',
-        }
-        
-        # Context-aware replacement would go here
+        # Greek letters and symbols: one linear scan over the text
+        # instead of one str.replace pass per symbol
+        text = replace_math_symbols(text)
+
+        # Context-aware replacement of _SPECIAL_CHARS would go here
         # For now, simple replacement in non-math contexts
-        
+
         return text
     
     def _apply_math_mode(self, text: str, mode: str) -> str:
@@ -274,21 +271,22 @@ class LaTeXConverter:
         
         return text
     
-    def _format_for_document(self, text: str) -> str:
+    def _format_for_document(self, text: str, protected: List[str]) -> str:
         """Format text for LaTeX document
-        
+
         Args:
             text: LaTeX text
-            
+            protected: Commands captured by _protect_existing_latex
+
         Returns:
             Formatted text
         """
-        # Restore protected LaTeX commands
-        if hasattr(self, '_protected_commands'):
-            for i, cmd in enumerate(self._protected_commands):
-                placeholder = f"__LATEX_CMD_{i}__"
-                text = text.replace(placeholder, cmd)
-        
+        # Restore protected LaTeX commands in one sub pass
+        if protected:
+            text = _PLACEHOLDER_RE.sub(
+                lambda m: protected[int(m.group(1))], text
+            )
+
         # Ensure proper line breaks
         text = text.replace('\n\n', '\n\\medskip\n')
         
@@ -366,15 +364,17 @@ class LaTeXConverter:
             doc_parts.append("\\maketitle")
             doc_parts.append("")
         
-        # Add questions
-        for i, question in enumerate(questions, 1):
-            latex_question = self.convert_question(question)
-            doc_parts.append(latex_question)
-            doc_parts.append("")
-            doc_parts.append("\\vspace{1em}")
-            doc_parts.append("")
-        
-        # End document
-        doc_parts.append("\\end{document}")
-        
-        return '\n'.join(doc_parts)
\ No newline at end of file
+        # Add questions. Conversion holds no shared state, so questions
+        # fan out across threads; the document assembles in one join
+        # instead of four list appends per question
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            converted = list(executor.map(self.convert_question, questions))
+
+        return '\n'.join(chain(
+            doc_parts,
+            (
+                f"{latex_question}\n\n\\vspace{{1em}}\n"
+                for latex_question in converted
+            ),
+            ("\\end{document}",),
+        ))
\ No newline at end of file
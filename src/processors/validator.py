@@ -2,8 +2,44 @@
 
 import re
 import logging
+from collections import Counter
 from typing import Dict, List, Optional, Tuple
 
+# Validation patterns compiled once at import; validate_latex runs per
+# question, so per-call re-cache probes add up
+_BEGIN_END_RE = re.compile(r'\\(begin|end)\{([^}]+)\}')
+_BRACE_RE = re.compile(r'(?<!\\)[{}]')
+_UNESCAPED_DOLLAR_RE = re.compile(r'(?<!\\)\$')
+_DOUBLE_SUB_RE = re.compile(r'_.*_')
+_DOUBLE_SUP_RE = re.compile(r'\^.*\^')
+_MISSING_BRACES_RE = re.compile(r'\\(frac|sqrt|sum|int)\s+[^{]')
+_BAD_FRAC_RE = re.compile(r'\\frac[^{]')
+_CMD_RE = re.compile(r'\\([a-zA-Z]+)')
+
+# One case-insensitive alternation finds any indicator in a single scan
+# instead of one full-text substring search per keyword, and skips the
+# lowercased copy of the text
+_INDICATOR_RE = re.compile(
+    r'\?|find|calculate|prove|show|determine|evaluate|solve|verify',
+    re.IGNORECASE
+)
+
+# Known-good LaTeX commands, built once instead of per validation call
+_VALID_COMMANDS = frozenset({
+    'frac', 'sqrt', 'sum', 'int', 'prod', 'lim',
+    'sin', 'cos', 'tan', 'log', 'ln', 'exp',
+    'alpha', 'beta', 'gamma', 'delta', 'theta',
+    'lambda', 'mu', 'sigma', 'phi', 'omega',
+    'infty', 'partial', 'nabla', 'times', 'cdot',
+    'leq', 'geq', 'neq', 'approx', 'equiv',
+    'subseteq', 'supseteq', 'in', 'notin',
+    'cup', 'cap', 'emptyset', 'forall', 'exists',
+    'rightarrow', 'leftarrow', 'Rightarrow', 'Leftarrow',
+    'text', 'textbf', 'textit', 'mathbf', 'mathit',
+    'begin', 'end', 'left', 'right', 'big', 'Big',
+    'binom', 'choose', 'pmatrix', 'bmatrix', 'vmatrix'
+})
+
 class Validator:
     """Validate extracted questions and LaTeX formatting"""
     
@@ -50,14 +86,7 @@ class Validator:
         Returns:
             True if has indicators
         """
-        indicators = [
-            '?',
-            'find', 'calculate', 'prove', 'show',
-            'determine', 'evaluate', 'solve', 'verify'
-        ]
-        
-        text_lower = text.lower()
-        return any(indicator in text_lower for indicator in indicators)
+        return _INDICATOR_RE.search(text) is not None
     
     def validate_latex(self, latex: str) -> List[str]:
         """Validate LaTeX syntax
@@ -98,15 +127,21 @@ class Validator:
         Returns:
             True if balanced
         """
+        # Fast path: unequal counts settle it with two C-level scans
+        # (escaped braces excluded, matching the delimiter check below)
+        if (latex.count('{') - latex.count('\\{')
+                != latex.count('}') - latex.count('\\}')):
+            return False
+
+        # Counts match; only an early '}' before its '{' can still make
+        # the string unbalanced. Visit just the brace positions instead
+        # of every character
         count = 0
-        for char in latex:
-            if char == '{':
-                count += 1
-            elif char == '}':
-                count -= 1
+        for match in _BRACE_RE.finditer(latex):
+            count += 1 if match.group(0) == '{' else -1
             if count < 0:
                 return False
-        return count == 0
+        return True
     
     def _check_balanced_delimiters(self, latex: str) -> bool:
         """Check if math delimiters are balanced
@@ -117,9 +152,9 @@ class Validator:
         Returns:
             True if balanced
         """
-        # Check $ delimiters
-        dollar_count = latex.count('$') - latex.count('\\$')
-        if dollar_count % 2 != 0:
+        # Check $ delimiters: one lookbehind scan rather than two
+        # full-string counts (and correct for escaped dollars)
+        if len(_UNESCAPED_DOLLAR_RE.findall(latex)) % 2 != 0:
             return False
         
         # Check \[ \] delimiters
@@ -130,10 +165,14 @@ class Validator:
         if latex.count('\\(') != latex.count('\\)'):
             return False
         
-        # Check environments
-        environments = re.findall(r'\\begin\{([^}]+)\}', latex)
-        for env in environments:
-            if latex.count(f'\\begin{{{env}}}') != latex.count(f'\\end{{{env}}}'):
+        # Check environments: one scan tallying begin/end per name
+        # instead of two full-string counts per environment
+        counts = Counter(_BEGIN_END_RE.findall(latex))
+        for (kind, env), n in counts.items():
+            if kind == 'begin' and n != counts[('end', env)]:
+                return False
+        for (kind, env), n in counts.items():
+            if kind == 'end' and counts[('begin', env)] == 0:
                 return False
         
         return True
@@ -150,15 +189,15 @@ class Validator:
         errors = []
         
         # Check for double subscripts/superscripts
-        if re.search(r'_.*_', latex) or re.search(r'\^.*\^', latex):
+        if _DOUBLE_SUB_RE.search(latex) or _DOUBLE_SUP_RE.search(latex):
             errors.append("Double subscripts or superscripts detected")
         
         # Check for missing braces after commands
-        if re.search(r'\\(frac|sqrt|sum|int)\s+[^{]', latex):
+        if _MISSING_BRACES_RE.search(latex):
             errors.append("Missing braces after command")
         
         # Check for invalid fraction syntax
-        if re.search(r'\\frac[^{]', latex):
+        if _BAD_FRAC_RE.search(latex):
             errors.append("Invalid fraction syntax")
         
         return errors
@@ -172,28 +211,10 @@ class Validator:
         Returns:
             List of invalid commands
         """
-        valid_commands = {
-            'frac', 'sqrt', 'sum', 'int', 'prod', 'lim',
-            'sin', 'cos', 'tan', 'log', 'ln', 'exp',
-            'alpha', 'beta', 'gamma', 'delta', 'theta',
-            'lambda', 'mu', 'sigma', 'phi', 'omega',
-            'infty', 'partial', 'nabla', 'times', 'cdot',
-            'leq', 'geq', 'neq', 'approx', 'equiv',
-            'subseteq', 'supseteq', 'in', 'notin',
-            'cup', 'cap', 'emptyset', 'forall', 'exists',
-            'rightarrow', 'leftarrow', 'Rightarrow', 'Leftarrow',
-            'text', 'textbf', 'textit', 'mathbf', 'mathit',
-            'begin', 'end', 'left', 'right', 'big', 'Big',
-            'binom', 'choose', 'pmatrix', 'bmatrix', 'vmatrix'
-        }
-        
-        # Find all commands in the LaTeX
-        commands = re.findall(r'\\([a-zA-Z]+)', latex)
-        
-        # Check for invalid commands
-        invalid = [cmd for cmd in commands if cmd not in valid_commands]
-        
-        return invalid
+        return [
+            cmd for cmd in _CMD_RE.findall(latex)
+            if cmd not in _VALID_COMMANDS
+        ]
     
     def validate_batch(self, questions: List[Dict]) -> Dict:
         """Validate a batch of questions
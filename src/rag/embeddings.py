@@ -1,6 +1,9 @@
 """Generate embeddings for text chunks"""
 
+import hashlib
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import List, Dict, Optional
 import numpy as np
 import google.generativeai as genai
@@ -8,6 +11,35 @@ from tenacity import retry, stop_after_attempt, wait_exponential
 
 from ..core.config import get_config
 from ..core.exceptions import LLMError
+from ..utils.file_handler import FileHandler
+
+# Maximum number of texts the embeddings endpoint accepts per request
+_EMBED_BATCH_SIZE = 100
+
+# In-flight batch requests; threads sit in network wait, so a handful
+# overlap nearly linearly without tripping per-minute quotas
+_EMBED_CONCURRENCY = 8
+
+# Storage dtype for embedding vectors: fp16 halves the bytes held in
+# RAM, the disk cache, and every downstream copy; math that needs the
+# precision (normalization, dot products) runs in fp32 first
+_STORE_DTYPE = np.float16
+
+def _unit(vectors: np.ndarray) -> np.ndarray:
+    """L2-normalize embedding vectors in place
+
+    With unit-norm vectors, cosine similarity is a plain dot product,
+    so downstream search never needs per-query norm computation.
+
+    Args:
+        vectors: 1D vector or 2D matrix of row vectors
+
+    Returns:
+        The normalized input
+    """
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    vectors /= norms + 1e-12
+    return vectors
 
 class EmbeddingGenerator:
     """Generate embeddings using Gemini"""
@@ -34,37 +66,181 @@ class EmbeddingGenerator:
         Returns:
             Embedding vector
         """
+        cached = self._cache_get(text)
+        if cached is not None:
+            return cached
+
         try:
             result = genai.embed_content(
                 model=self.model,
                 content=text,
                 task_type="retrieval_document"
             )
-            return np.array(result['embedding'])
+            embedding = _unit(
+                np.asarray(result['embedding'], dtype=np.float32)
+            ).astype(_STORE_DTYPE)
+            self._cache_put(text, embedding)
+            return embedding
         except Exception as e:
             self.logger.error(f"Error generating embedding: {e}")
             raise LLMError(f"Failed to generate embedding: {e}")
     
-    def generate_batch_embeddings(self, texts: List[str]) -> List[np.ndarray]:
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=4, max=10)
+    )
+    def _embed_batch(self, texts: List[str]) -> List[np.ndarray]:
+        """Embed a batch of texts in one API request
+
+        Args:
+            texts: Batch of texts (at most _EMBED_BATCH_SIZE)
+
+        Returns:
+            List of embedding vectors, one per text
+        """
+        result = genai.embed_content(
+            model=self.model,
+            content=texts,
+            task_type="retrieval_document"
+        )
+        return [_unit(np.asarray(emb, dtype=np.float32)).astype(_STORE_DTYPE)
+                for emb in result['embedding']]
+
+    def generate_batch_embeddings(self, texts: List[str]) -> np.ndarray:
         """Generate embeddings for multiple texts
-        
+
         Args:
             texts: List of texts
-            
+
+        Returns:
+            2D float16 array of shape (len(texts), embedding_dim)
+        """
+        if not texts:
+            return np.zeros((0, 768), dtype=_STORE_DTYPE)
+
+        # Reprocessing a PDF re-embeds identical documents; look each
+        # one up on disk first and only send the misses to the API
+        rows: List[Optional[np.ndarray]] = [self._cache_get(t) for t in texts]
+        miss_indices = [i for i, row in enumerate(rows) if row is None]
+
+        if miss_indices:
+            miss_vectors = self._embed_many([texts[i] for i in miss_indices])
+            for i, vector in zip(miss_indices, miss_vectors):
+                rows[i] = vector
+                self._cache_put(texts[i], vector)
+
+        return np.asarray(rows)
+
+    def _embed_many(self, texts: List[str]) -> List[np.ndarray]:
+        """Embed texts through the batched (and, when large enough,
+        concurrent) API path
+
+        Args:
+            texts: Texts to embed
+
         Returns:
-            List of embedding vectors
+            List of embedding vectors, one per text
         """
+        # One request per batch instead of one blocking round-trip per
+        # text: the HTTPS latency, not the embedding itself, dominates
+        # indexing time
+        batches = [
+            texts[start:start + _EMBED_BATCH_SIZE]
+            for start in range(0, len(texts), _EMBED_BATCH_SIZE)
+        ]
+
+        if len(batches) == 1:
+            return self._embed_batch_with_fallback(texts)
+
+        # Batches run concurrently: the workers spend their time in
+        # network wait, so the GIL is no obstacle. map preserves order
         embeddings = []
-        
-        for text in texts:
+        with ThreadPoolExecutor(max_workers=_EMBED_CONCURRENCY) as executor:
+            for batch_embeddings in executor.map(
+                self._embed_batch_with_fallback, batches
+            ):
+                embeddings.extend(batch_embeddings)
+
+        return embeddings
+
+    def _cache_path(self, text: str) -> Optional[Path]:
+        """Get the disk-cache path for a text's embedding
+
+        Args:
+            text: Text to be embedded
+
+        Returns:
+            Cache file path, or None when caching is disabled
+        """
+        if not self.config.cache_enabled:
+            return None
+
+        key = hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+        return self.config.cache_dir / "embeddings" / f"{key}.pkl"
+
+    def _cache_get(self, text: str) -> Optional[np.ndarray]:
+        """Load a cached embedding, if present
+
+        Args:
+            text: Text to be embedded
+
+        Returns:
+            Cached embedding vector, or None on miss
+        """
+        cache_path = self._cache_path(text)
+
+        if cache_path is None or not cache_path.exists():
+            return None
+
+        try:
+            return FileHandler.load_pickle(cache_path)
+        except Exception as e:
+            self.logger.warning(f"Failed to read embedding cache: {e}")
+            return None
+
+    def _cache_put(self, text: str, embedding: np.ndarray):
+        """Store an embedding in the disk cache
+
+        Args:
+            text: Text the embedding belongs to
+            embedding: Embedding vector
+        """
+        cache_path = self._cache_path(text)
+
+        if cache_path is None:
+            return
+
+        try:
+            FileHandler.save_pickle(embedding, cache_path)
+        except Exception as e:
+            self.logger.warning(f"Failed to write embedding cache: {e}")
+
+    def _embed_batch_with_fallback(self, batch: List[str]) -> List[np.ndarray]:
+        """Embed one batch, degrading to per-item requests on failure
+
+        Args:
+            batch: Batch of texts
+
+        Returns:
+            List of embedding vectors, one per text
+        """
+        try:
+            return self._embed_batch(batch)
+        except Exception as e:
+            self.logger.warning(
+                f"Batch embedding failed, retrying items individually: {e}"
+            )
+
+        # Per-item fallback so one bad text doesn't sink the batch
+        embeddings = []
+        for text in batch:
             try:
-                embedding = self.generate_embedding(text)
-                embeddings.append(embedding)
+                embeddings.append(self.generate_embedding(text))
             except Exception as e:
                 self.logger.warning(f"Failed to embed text: {e}")
                 # Use zero vector as fallback
-                embeddings.append(np.zeros(768))
-        
+                embeddings.append(np.zeros(768, dtype=_STORE_DTYPE))
+
         return embeddings
     
     def generate_query_embedding(self, query: str) -> np.ndarray:
@@ -82,7 +258,7 @@ class EmbeddingGenerator:
                 content=query,
                 task_type="retrieval_query"
             )
-            return np.array(result['embedding'])
+            return _unit(np.asarray(result['embedding'], dtype=np.float32))
         except Exception as e:
             self.logger.error(f"Error generating query embedding: {e}")
             raise LLMError(f"Failed to generate query embedding: {e}")
\ No newline at end of file
@@ -1,6 +1,8 @@
 """RAG pipeline orchestration"""
 
 import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from tqdm import tqdm
@@ -12,9 +14,23 @@ from ..extractors.pdf_extractor import PDFExtractor
 from ..extractors.question_extractor import QuestionExtractor
 from ..processors.text_processor import TextProcessor
 from ..processors.latex_converter import LaTeXConverter
+from ..processors.validator import Validator
 from ..llm.gemini_client import GeminiClient
 from ..core.config import get_config
 
+# Pre-filters that decide whether a question needs the LLM at all:
+# text that is already LaTeX passes through untouched, text with no
+# math has nothing to convert, and simple math goes through the local
+# rule-based converter — only questions the rules can't handle cleanly
+# pay for a network round-trip
+_HAS_LATEX_RE = re.compile(r'\\(?:frac|int|sum|sqrt|begin)|\$[^$]+\$')
+_HAS_MATH_RE = re.compile(r'[=+\-*/^√∫Σ]|\d+\s*/\s*\d+')
+
+# Concurrent LaTeX conversions: the slow path is a Gemini round-trip,
+# so overlapping conversions with page preprocessing hides the network
+# latency behind CPU work
+_LATEX_WORKERS = 8
+
 class RAGPipeline:
     """Complete RAG pipeline for question extraction"""
     
@@ -31,6 +47,7 @@ class RAGPipeline:
         self.embedding_generator = EmbeddingGenerator()
         self.vector_store = VectorStore()
         self.retriever = Retriever(self.vector_store)
+        self.validator = Validator()
         self.llm_client = GeminiClient()
     
     def process_pdf(
@@ -56,24 +73,31 @@ class RAGPipeline:
             pdf_path, chapter, topic
         )
         
-        # Process extracted pages
+        # Process extracted pages, kicking off each question's LaTeX
+        # conversion as soon as it is extracted: the LLM round-trips run
+        # in worker threads while the main thread keeps preprocessing
+        # the remaining pages
         all_questions = []
-        
-        for page in tqdm(pdf_content['pages'], desc="Processing pages"):
-            # Preprocess text
-            processed_text = self.text_processor.preprocess(page['text'])
-            
-            # Extract questions
-            questions = self.question_extractor.extract(processed_text)
-            
-            # Add page number to questions
-            for q in questions:
-                q.page_number = page['page_number']
-            
-            all_questions.extend(questions)
-        
-        # Convert to LaTeX using LLM
-        latex_questions = self._convert_questions_to_latex(all_questions)
+        latex_futures = []
+
+        with ThreadPoolExecutor(max_workers=_LATEX_WORKERS) as executor:
+            for page in tqdm(pdf_content['pages'], desc="Processing pages"):
+                # Preprocess text
+                processed_text = self.text_processor.preprocess(page['text'])
+
+                # Extract questions
+                questions = self.question_extractor.extract(processed_text)
+
+                # Add page number and schedule LaTeX conversion
+                for q in questions:
+                    q.page_number = page['page_number']
+                    latex_futures.append(executor.submit(self._to_latex, q.text))
+
+                all_questions.extend(questions)
+
+            latex_questions = self._convert_questions_to_latex(
+                all_questions, latex_futures
+            )
         
         # Index questions for future retrieval
         self._index_questions(latex_questions, chapter, topic)
@@ -86,25 +110,24 @@ class RAGPipeline:
             'metadata': pdf_content['metadata']
         }
     
-    def _convert_questions_to_latex(self, questions: List) -> List[Dict]:
-        """Convert questions to LaTeX format using LLM
+    def _convert_questions_to_latex(self, questions: List,
+                                    latex_futures: List) -> List[Dict]:
+        """Collect LaTeX conversion results into question records
         
         Args:
             questions: List of Question objects
+            latex_futures: In-flight conversion futures, one per question
             
         Returns:
             List of LaTeX formatted questions
         """
         latex_questions = []
-        
-        for question in tqdm(questions, desc="Converting to LaTeX"):
-            # Use LLM for accurate conversion
-            latex_text = self.llm_client.convert_to_latex(question.text)
-            
-            # Fallback to rule-based converter if LLM fails
-            if not latex_text:
-                latex_text = self.latex_converter.convert(question.text)
-            
+
+        for question, future in zip(
+            tqdm(questions, desc="Converting to LaTeX"), latex_futures
+        ):
+            latex_text = future.result()
+
             latex_questions.append({
                 'original_text': question.text,
                 'latex': latex_text,
@@ -115,7 +138,36 @@ class RAGPipeline:
             })
         
         return latex_questions
-    
+
+    def _to_latex(self, text: str) -> str:
+        """Convert one question's text to LaTeX, using the LLM only
+        when the cheap paths can't handle it
+
+        Args:
+            text: Question text
+
+        Returns:
+            LaTeX formatted text
+        """
+        # Already LaTeX: nothing to convert
+        if _HAS_LATEX_RE.search(text):
+            return text
+
+        # No math at all: the text is its own LaTeX
+        if not _HAS_MATH_RE.search(text):
+            return text
+
+        # Try the local rule-based converter; keep its output when the
+        # validator finds no problems
+        latex_text = self.latex_converter.convert(text)
+        if not self.validator.validate_latex(latex_text):
+            return latex_text
+
+        # Fall back to the LLM for what the rules mangled
+        llm_latex = self.llm_client.convert_to_latex(text)
+
+        return llm_latex or latex_text
+
     def _index_questions(self, questions: List[Dict], chapter: int, topic: str):
         """Index questions for retrieval
         
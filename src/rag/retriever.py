@@ -19,6 +19,11 @@ class Retriever:
         self.logger = logging.getLogger(__name__)
         self.embedding_generator = EmbeddingGenerator()
         self.vector_store = vector_store or VectorStore()
+
+        # Token sets computed once at index time, keyed by document id,
+        # so reranking never re-lowercases and re-splits candidates on
+        # every query
+        self._doc_tokens: Dict[str, frozenset] = {}
     
     def retrieve(
         self,
@@ -61,23 +66,30 @@ class Retriever:
         Returns:
             Reranked results
         """
-        # Simple reranking based on keyword matching
+        # Simple reranking based on keyword matching, fused with score
+        # combination in a single pass over the results
         query_words = set(query.lower().split())
-        
+        query_len = len(query_words)
+
         for result in results:
-            doc_words = set(result['document'].lower().split())
+            # Tokens cached at index time; documents indexed elsewhere
+            # (or loaded from a persisted store) are tokenized here
+            doc_words = self._doc_tokens.get(result['id'])
+            if doc_words is None:
+                doc_words = frozenset(result['document'].lower().split())
+
             overlap = len(query_words & doc_words)
-            result['keyword_score'] = overlap / len(query_words) if query_words else 0
-        
-        # Combine vector similarity and keyword score
-        for result in results:
-            vector_score = 1 / (1 + result['distance'])  # Convert distance to similarity
-            keyword_score = result['keyword_score']
+            keyword_score = overlap / query_len if query_len else 0
+
+            # Convert distance to similarity
+            vector_score = 1 / (1 + result['distance'])
+
+            result['keyword_score'] = keyword_score
             result['combined_score'] = 0.7 * vector_score + 0.3 * keyword_score
-        
+
         # Sort by combined score
         results.sort(key=lambda x: x['combined_score'], reverse=True)
-        
+
         return results
     
     def add_documents_to_index(
@@ -93,12 +105,27 @@ class Retriever:
         """
         # Generate embeddings
         embeddings = self.embedding_generator.generate_batch_embeddings(documents)
-        
+
+        # Offset new ids by the store's current count so repeat calls in
+        # one session don't reissue doc_0..doc_N: colliding ids made
+        # Chroma keep the old documents while the token cache moved on
+        # to the new ones, and reranking then scored against the wrong
+        # token sets
+        offset = self.vector_store.get_collection_info()['count']
+        ids = [f"doc_{offset + i}" for i in range(len(documents))]
+
         # Add to vector store
         self.vector_store.add_documents(
             documents=documents,
             embeddings=embeddings,
-            metadatas=metadatas
+            metadatas=metadatas,
+            ids=ids
         )
-        
+
+        # Tokenize once here rather than on every rerank
+        self._doc_tokens.update(
+            (doc_id, frozenset(doc.lower().split()))
+            for doc_id, doc in zip(ids, documents)
+        )
+
         self.logger.info(f"Added {len(documents)} documents to index")
\ No newline at end of file
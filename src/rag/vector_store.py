@@ -9,65 +9,183 @@ import chromadb
 from chromadb.config import Settings
 
 from ..core.config import get_config
+from ..utils.file_handler import FileHandler
+
+# How many extra candidates to over-fetch when filtering client-side;
+# results outside the allowed id set are discarded after the search
+_FILTER_OVERSHOOT = 4
+
+def _hnsw_params(expected_size: int) -> Dict:
+    """Pick HNSW graph parameters for the expected corpus size
+
+    Chroma's defaults (M=16, construction_ef=100, search_ef=10) degrade
+    badly past ~100K vectors; wider graphs cost more build time and
+    memory but keep recall and tail latency flat as the index grows.
+
+    Args:
+        expected_size: Expected number of vectors in the collection
+
+    Returns:
+        Dictionary of hnsw:* collection metadata entries
+    """
+    if expected_size < 100_000:
+        m, construction_ef = 16, 64
+    elif expected_size < 1_000_000:
+        m, construction_ef = 24, 128
+    else:
+        m, construction_ef = 32, 200
+
+    return {
+        "hnsw:space": "cosine",
+        "hnsw:M": m,
+        "hnsw:construction_ef": construction_ef,
+        "hnsw:search_ef": 64,
+    }
 
 class VectorStore:
     """Store and retrieve vectors using ChromaDB"""
-    
-    def __init__(self, collection_name: str = "rd_sharma_questions"):
+
+    def __init__(self, collection_name: str = "rd_sharma_questions",
+                 expected_size: int = 50_000):
         """Initialize vector store
-        
+
         Args:
             collection_name: Name of the collection
+            expected_size: Expected vector count, used to size the HNSW
+                graph (only applied when the collection is first created)
         """
         self.config = get_config()
         self.logger = logging.getLogger(__name__)
         self.collection_name = collection_name
-        
+
         # Initialize ChromaDB
         self.client = chromadb.PersistentClient(
             path=str(self.config.vector_store_path),
             settings=Settings(anonymized_telemetry=False)
         )
-        
+
         # Get or create collection
         self.collection = self.client.get_or_create_collection(
             name=collection_name,
-            metadata={"description": "RD Sharma questions and solutions"}
+            metadata={
+                "description": "RD Sharma questions and solutions",
+                **_hnsw_params(expected_size),
+            }
+        )
+
+        # Write-through document count: collection.count() is a SQLite
+        # query on every call, but this process is the only writer, so
+        # one read at startup plus increments on add stays accurate
+        self._count = self.collection.count()
+
+        # Side inverted index (field -> value -> doc ids): Chroma's
+        # where-filtering degrades badly past ~50K documents, while the
+        # metadata fields used here (chapter, topic) are low-cardinality
+        # and cheap to intersect client-side
+        self._meta_index_path = (
+            self.config.vector_store_path / f"{collection_name}_meta_index.pkl"
         )
+        self._meta_index = self._load_meta_index()
     
     def add_documents(
         self,
         documents: List[str],
-        embeddings: List[np.ndarray],
+        embeddings: np.ndarray,
         metadatas: List[Dict] = None,
-        ids: List[str] = None
+        ids: List[str] = None,
+        batch_size: int = 256
     ):
         """Add documents to vector store
-        
+
         Args:
             documents: List of document texts
-            embeddings: List of embeddings
+            embeddings: 2D embedding matrix (one row per document)
             metadatas: List of metadata dicts
             ids: List of document IDs
+            batch_size: Documents per underlying add() call
         """
         if ids is None:
             ids = [f"doc_{i}" for i in range(len(documents))]
-        
+
         if metadatas is None:
             metadatas = [{}] * len(documents)
-        
-        # Convert numpy arrays to lists for ChromaDB
-        embeddings_list = [emb.tolist() for emb in embeddings]
-        
-        self.collection.add(
-            documents=documents,
-            embeddings=embeddings_list,
-            metadatas=metadatas,
-            ids=ids
-        )
-        
+
+        # Upcast once so reduced storage dtypes round-trip as
+        # full-precision floats (also accepts a legacy list of 1D rows)
+        embedding_matrix = np.asarray(embeddings, dtype=np.float32)
+
+        # Insert in moderate sub-batches: one giant add() becomes a
+        # single huge SQLite transaction with a proportional payload,
+        # while sub-batches amortize transaction overhead at bounded
+        # per-call memory. Each slice converts with one tolist() call
+        for start in range(0, len(documents), batch_size):
+            end = start + batch_size
+            self.collection.add(
+                documents=documents[start:end],
+                embeddings=embedding_matrix[start:end].tolist(),
+                metadatas=metadatas[start:end],
+                ids=ids[start:end]
+            )
+
+        self._index_metadata(ids, metadatas)
+        self._count += len(documents)
+
         self.logger.info(f"Added {len(documents)} documents to vector store")
-    
+
+    def _load_meta_index(self) -> Dict:
+        """Load the persisted metadata index, if present
+
+        Returns:
+            Mapping of field -> value -> set of document ids
+        """
+        if not self._meta_index_path.exists():
+            return {}
+
+        try:
+            return FileHandler.load_pickle(self._meta_index_path)
+        except Exception as e:
+            self.logger.warning(f"Failed to read metadata index: {e}")
+            return {}
+
+    def _index_metadata(self, ids: List[str], metadatas: List[Dict]):
+        """Record metadata values in the side index and persist it
+
+        Args:
+            ids: Document ids just added
+            metadatas: Their metadata dicts
+        """
+        for doc_id, metadata in zip(ids, metadatas):
+            for field, value in metadata.items():
+                self._meta_index.setdefault(field, {}) \
+                    .setdefault(value, set()).add(doc_id)
+
+        try:
+            FileHandler.save_pickle(self._meta_index, self._meta_index_path)
+        except Exception as e:
+            self.logger.warning(f"Failed to write metadata index: {e}")
+
+    def _allowed_ids(self, filter_dict: Dict) -> Optional[set]:
+        """Resolve a filter to a set of candidate document ids
+
+        Args:
+            filter_dict: Metadata filters (field -> required value)
+
+        Returns:
+            Set of matching ids, or None when the side index doesn't
+            cover every filtered field (caller falls back to Chroma)
+        """
+        allowed = None
+
+        for field, value in filter_dict.items():
+            by_value = self._meta_index.get(field)
+            if by_value is None:
+                return None
+
+            ids = by_value.get(value, set())
+            allowed = ids if allowed is None else allowed & ids
+
+        return allowed
+
     def search(
         self,
         query_embedding: np.ndarray,
@@ -84,22 +202,92 @@ class VectorStore:
         Returns:
             List of search results
         """
+        # Nothing to find: skip the HNSW traversal (and Chroma's
+        # awkward handling of empty collections) entirely
+        if n_results <= 0 or self._count == 0:
+            return []
+
+        # Prefer the side index for filtering: over-fetch unfiltered
+        # candidates and intersect with the allowed ids, avoiding
+        # Chroma's slow metadata where-path on large collections
+        allowed = self._allowed_ids(filter_dict) if filter_dict else None
+
+        if filter_dict and allowed is None:
+            results = self.collection.query(
+                query_embeddings=[query_embedding.tolist()],
+                n_results=n_results,
+                where=filter_dict
+            )
+            return self._format_results(results, 0)
+
         results = self.collection.query(
             query_embeddings=[query_embedding.tolist()],
+            n_results=n_results * _FILTER_OVERSHOOT if allowed is not None
+                      else n_results
+        )
+
+        formatted = self._format_results(results, 0)
+
+        if allowed is not None:
+            formatted = [r for r in formatted if r['id'] in allowed][:n_results]
+
+        return formatted
+
+    def search_many(
+        self,
+        query_embeddings: np.ndarray,
+        n_results: int = 5,
+        filter_dict: Dict = None
+    ) -> List[List[Dict]]:
+        """Search for similar documents for many queries at once
+
+        One query() call covers all the vectors, so Chroma batches the
+        HNSW traversals internally instead of paying the Python/SQLite
+        boundary once per query.
+
+        Args:
+            query_embeddings: 2D matrix of query vectors (one per row)
+            n_results: Number of results per query
+            filter_dict: Metadata filters applied to every query
+
+        Returns:
+            One list of search results per query, in input order
+        """
+        query_list = np.asarray(query_embeddings, dtype=np.float32).tolist()
+
+        if n_results <= 0 or self._count == 0:
+            return [[] for _ in query_list]
+
+        results = self.collection.query(
+            query_embeddings=query_list,
             n_results=n_results,
             where=filter_dict
         )
-        
-        # Format results
+
+        return [
+            self._format_results(results, i) for i in range(len(query_list))
+        ]
+
+    @staticmethod
+    def _format_results(results: Dict, query_index: int) -> List[Dict]:
+        """Format one query's slice of a ChromaDB result set
+
+        Args:
+            results: Raw ChromaDB query response
+            query_index: Which query's results to format
+
+        Returns:
+            List of search results
+        """
         formatted_results = []
-        for i in range(len(results['documents'][0])):
+        for i in range(len(results['documents'][query_index])):
             formatted_results.append({
-                'document': results['documents'][0][i],
-                'metadata': results['metadatas'][0][i] if results['metadatas'] else {},
-                'distance': results['distances'][0][i] if results['distances'] else 0,
-                'id': results['ids'][0][i] if results['ids'] else None
+                'document': results['documents'][query_index][i],
+                'metadata': results['metadatas'][query_index][i] if results['metadatas'] else {},
+                'distance': results['distances'][query_index][i] if results['distances'] else 0,
+                'id': results['ids'][query_index][i] if results['ids'] else None
             })
-        
+
         return formatted_results
     
     def delete_collection(self):
@@ -113,13 +301,23 @@ class VectorStore:
         Returns:
             Collection information
         """
-        count = self.collection.count()
-        
         return {
             'name': self.collection_name,
-            'count': count,
+            'count': self._count,
             'metadata': self.collection.metadata
         }
+
+    def refresh_count(self) -> int:
+        """Re-read the document count from the collection
+
+        Escape hatch for when another process may have written to the
+        same persistent store.
+
+        Returns:
+            Current document count
+        """
+        self._count = self.collection.count()
+        return self._count
     
     def update_document(self, doc_id: str, document: str, embedding: np.ndarray, metadata: Dict = None):
         """Update a document in the store
@@ -133,6 +331,6 @@ class VectorStore:
         self.collection.update(
             ids=[doc_id],
             documents=[document],
-            embeddings=[embedding.tolist()],
+            embeddings=[np.asarray(embedding, dtype=np.float32).tolist()],
             metadatas=[metadata] if metadata else None
         )
\ No newline at end of file
@@ -1,27 +1,72 @@
 """Helper functions"""
 
+import functools
 import hashlib
+import time
+from pathlib import Path
 from typing import Any, Dict, List, Optional
 from datetime import datetime
 
+# Last formatted timestamp, keyed by whole second: formatting only
+# changes once per second, so tight loops skip datetime construction
+# and isoformat entirely. A racing update writes the same value, so no
+# lock is needed
+_TS_CACHE = [0, ""]
+
+def file_digest(filepath: Path, digest_size: int = 16) -> str:
+    """Compute a content digest of a file
+
+    Reads in chunks so large files never sit in memory whole.
+
+    Args:
+        filepath: Path to file
+        digest_size: Digest length in bytes
+
+    Returns:
+        Hex digest of the file contents
+    """
+    digest = hashlib.blake2b(digest_size=digest_size)
+
+    with open(filepath, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+# Filename-invalid characters mapped to '_' in a single translate pass
+_INVALID_FILENAME_TABLE = str.maketrans({c: '_' for c in '<>:"/\\|?*'})
+
+@functools.lru_cache(maxsize=65536)
 def generate_id(text: str) -> str:
     """Generate unique ID from text
-    
+
+    Cached: chunking and dedup retries hash the same strings over and
+    over, and repeat IDs cost a dict probe instead of a digest.
+
     Args:
         text: Input text
-        
+
     Returns:
         Unique ID
     """
-    return hashlib.md5(text.encode()).hexdigest()[:12]
+    # IDs are for deduplication, not security: blake2b is a single pass
+    # and faster than MD5 on short inputs, and sizing the digest to 6
+    # bytes keeps the familiar 12-hex-char IDs without slicing
+    return hashlib.blake2b(text.encode(), digest_size=6).hexdigest()
 
 def timestamp() -> str:
-    """Get current timestamp
-    
+    """Get current timestamp at second granularity
+
     Returns:
         ISO format timestamp
     """
-    return datetime.now().isoformat()
+    now = int(time.time())
+
+    if now != _TS_CACHE[0]:
+        _TS_CACHE[0] = now
+        _TS_CACHE[1] = datetime.fromtimestamp(now).isoformat()
+
+    return _TS_CACHE[1]
 
 def chunk_text(text: str, chunk_size: int = 1000, overlap: int = 200) -> List[str]:
     """Chunk text with overlap
@@ -34,16 +79,14 @@ def chunk_text(text: str, chunk_size: int = 1000, overlap: int = 200) -> List[st
     Returns:
         List of chunks
     """
-    chunks = []
-    start = 0
-    
-    while start < len(text):
-        end = start + chunk_size
-        chunk = text[start:end]
-        chunks.append(chunk)
-        start = end - overlap
-    
-    return chunks
+    # Clamp the stride so overlap >= chunk_size can't loop forever, and
+    # let range() drive the starts instead of per-iteration arithmetic
+    stride = max(1, chunk_size - overlap)
+
+    return [
+        text[start:start + chunk_size]
+        for start in range(0, len(text), stride)
+    ]
 
 def clean_filename(filename: str) -> str:
     """Clean filename for safe saving
@@ -54,12 +97,9 @@ def clean_filename(filename: str) -> str:
     Returns:
         Cleaned filename
     """
-    # Remove invalid characters
-    invalid_chars = '<>:"/\\|?*'
-    for char in invalid_chars:
-        filename = filename.replace(char, '_')
-    
-    return filename
+    # Remove invalid characters: one C-level pass instead of one
+    # replace() scan per character
+    return filename.translate(_INVALID_FILENAME_TABLE)
 
 def format_question_output(question: Dict) -> str:
     """Format question for display
@@ -70,15 +110,16 @@ def format_question_output(question: Dict) -> str:
     Returns:
         Formatted string
     """
-    output = []
-    
-    if question.get('number'):
-        output.append(f"Question {question['number']}:")
-    
-    output.append(question.get('latex', question.get('text', '')))
-    
-    if question.get('parts'):
-        for i, part in enumerate(question['parts']):
-            output.append(f"  ({chr(97+i)}) {part}")
-    
-    return '\n'.join(output)
\ No newline at end of file
+    number = question.get('number')
+    body = question.get('latex') or question.get('text', '')
+    parts = question.get('parts') or ()
+
+    # Build the lines in one expression and join once; no incremental
+    # list growth or repeated dict lookups
+    lines = (
+        *((f"Question {number}:",) if number else ()),
+        body,
+        *(f"  ({chr(97 + i)}) {part}" for i, part in enumerate(parts)),
+    )
+
+    return '\n'.join(lines)
\ No newline at end of file
@@ -1,48 +1,83 @@
 """Logging configuration"""
 from typing import Optional
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from datetime import datetime
 
+def _stop_listener(listener: QueueListener):
+    """Stop a queue listener, tolerating repeated calls
+
+    QueueListener.stop() isn't idempotent; this guard lets the atexit
+    hook and an explicit re-setup both run safely.
+
+    Args:
+        listener: Listener to stop
+    """
+    if listener._thread is not None:
+        listener.stop()
+
 def setup_logger(
     name: str = "rd_sharma_extractor",
     level: str = "INFO",
     log_file: Optional[Path] = None
 ) -> logging.Logger:
     """Setup logger configuration
-    
+
+    Records pass through a QueueHandler to a background QueueListener,
+    so emitting a record costs one queue put on the hot path while the
+    listener thread does the formatting and console/file I/O.
+
     Args:
         name: Logger name
         level: Log level
         log_file: Optional log file path
-        
+
     Returns:
         Configured logger
     """
     # Create logger
     logger = logging.getLogger(name)
     logger.setLevel(getattr(logging, level.upper()))
-    
-    # Remove existing handlers
+
+    # Remove existing handlers (stopping any listener a previous call
+    # attached, so its thread and file handle don't leak)
+    for handler in logger.handlers:
+        listener = getattr(handler, '_listener', None)
+        if listener is not None:
+            _stop_listener(listener)
     logger.handlers = []
-    
+
     # Create formatter
     formatter = logging.Formatter(
         '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S'
     )
-    
+
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
-    
+    handlers = [console_handler]
+
     # File handler if specified
     if log_file:
         log_file.parent.mkdir(parents=True, exist_ok=True)
         file_handler = logging.FileHandler(log_file)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
-    
-    return logger
\ No newline at end of file
+        handlers.append(file_handler)
+
+    # The logger only sees the queue handler; the real handlers (with
+    # their formatters) run on the listener thread
+    log_queue = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    logger.addHandler(queue_handler)
+
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    queue_handler._listener = listener
+    atexit.register(_stop_listener, listener)
+
+    return logger